@@ -1,10 +1,31 @@
 import os
-from typing import List, Optional, Dict, Any
+import sys
+import copy
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
-import json
 from pathlib import Path
 
-@dataclass
+import json_utils
+
+# from_json 파일 내용 캐시: 절대 경로 -> (mtime_ns, 파싱된 설정 딕셔너리)
+# 설정 객체는 매번 새로 만들어 __post_init__의 검증과 디렉토리 생성이 항상 실행되도록 함
+_APPCONFIG_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# 모델 타입별 기본 API 베이스 URL
+_API_BASE_DEFAULTS = {
+    "ollama": "http://localhost:11434/api",
+    "openai": "https://api.openai.com/v1",
+    "claude": "https://api.anthropic.com/v1",
+}
+
+# Python 3.10 이상에서는 __slots__ 기반 데이터클래스 사용 (인스턴스 __dict__ 제거)
+_DATACLASS_KW: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+def _get_api_key(model_type: str) -> Optional[str]:
+    """환경 변수에서 모델 타입에 해당하는 API 키 조회 (실행 중 설정된 키도 반영되도록 매번 조회)"""
+    return os.environ.get(f"{model_type.upper()}_API_KEY")
+
+@dataclass(**_DATACLASS_KW)
 class ModelConfig:
     """LLM 모델 설정을 위한 클래스"""
     model_type: str  # ollama, huggingface, openai, claude 등
@@ -23,8 +44,7 @@ class ModelConfig:
         
         # 환경 변수에서 API 키 로드 (설정되지 않은 경우)
         if self.api_key is None:
-            env_var_name = f"{self.model_type.upper()}_API_KEY"
-            self.api_key = os.environ.get(env_var_name)
+            self.api_key = _get_api_key(self.model_type)
         
         # API 키가 필요한 모델인지 확인
         api_key_required = self.model_type in ["openai", "claude", "huggingface"]
@@ -33,12 +53,7 @@ class ModelConfig:
         
         # API 베이스 URL이 설정되지 않은 경우 기본값 설정
         if self.api_base is None:
-            if self.model_type == "ollama":
-                self.api_base = "http://localhost:11434/api"
-            elif self.model_type == "openai":
-                self.api_base = "https://api.openai.com/v1"
-            elif self.model_type == "claude":
-                self.api_base = "https://api.anthropic.com/v1"
+            self.api_base = _API_BASE_DEFAULTS.get(self.model_type)
         
         # 온도 범위 검증
         if not 0 <= self.temperature <= 1:
@@ -46,7 +61,7 @@ class ModelConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """설정을 딕셔너리로 변환 (API 키 제외)"""
-        config_dict = {
+        return {
             "model_type": self.model_type,
             "model_name": self.model_name,
             "temperature": self.temperature,
@@ -55,9 +70,8 @@ class ModelConfig:
             "api_base": self.api_base,
             "streaming": self.streaming
         }
-        return config_dict
 
-@dataclass
+@dataclass(**_DATACLASS_KW)
 class AppConfig:
     """애플리케이션 전체 설정을 위한 클래스"""
     schema_path: Path  # 데이터베이스 스키마 파일 경로
@@ -79,10 +93,12 @@ class AppConfig:
     validate_sql: bool = True
     max_retries: int = 3
     timeout: int = 60
+    requests_per_second: Optional[float] = None  # 초당 최대 모델 요청 수 (None이면 제한 없음)
     
     # 출력 설정
     output_format: str = "json"  # json, csv, excel
     log_level: str = "INFO"
+    async_logging: bool = False  # 로그 출력을 별도 스레드에서 수행 (Rich 트레이스백 대신 텍스트 트레이스백 출력)
     
     def __post_init__(self):
         """경로 변환 및 설정값 검증"""
@@ -103,9 +119,11 @@ class AppConfig:
         if self.initial_qa_path and not self.initial_qa_path.exists():
             raise FileNotFoundError(f"초기 Q&A 파일이 존재하지 않습니다: {self.initial_qa_path}")
         
-        # 출력 디렉토리가 없으면 생성
-        if not self.output_path.exists():
+        # 출력 디렉토리가 없으면 생성 (이미 있으면 무시)
+        try:
             self.output_path.mkdir(parents=True)
+        except FileExistsError:
+            pass
         
         # 출력 형식 검증
         valid_formats = ["json", "csv", "excel"]
@@ -119,7 +137,7 @@ class AppConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """설정을 딕셔너리로 변환"""
-        config_dict = {
+        return {
             "schema_path": str(self.schema_path),
             "output_path": str(self.output_path),
             "model_config": self.model_config.to_dict(),
@@ -133,16 +151,28 @@ class AppConfig:
             "validate_sql": self.validate_sql,
             "max_retries": self.max_retries,
             "timeout": self.timeout,
+            "requests_per_second": self.requests_per_second,
             "output_format": self.output_format,
-            "log_level": self.log_level
+            "log_level": self.log_level,
+            "async_logging": self.async_logging
         }
-        return config_dict
     
     @classmethod
     def from_json(cls, json_path: str) -> 'AppConfig':
-        """JSON 파일에서 설정 로드"""
-        with open(json_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
+        """JSON 파일에서 설정 로드
+        
+        파일이 변경되지 않았으면 캐시된 파일 내용으로 설정 객체를 새로 만들므로
+        파일을 다시 읽지 않으면서도 검증과 출력 디렉토리 생성은 매번 수행됩니다.
+        """
+        cache_key = str(Path(json_path).resolve())
+        mtime_ns = os.stat(json_path).st_mtime_ns
+        cached = _APPCONFIG_CACHE.get(cache_key)
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, json_utils.load_file(json_path))
+            _APPCONFIG_CACHE[cache_key] = cached
+        
+        # 캐시된 내용은 수정하지 않도록 복사본 사용
+        config_data = copy.deepcopy(cached[1])
         
         # ModelConfig 객체 생성
         model_data = config_data.pop('model_config')
@@ -155,8 +185,7 @@ class AppConfig:
 
     def save_json(self, json_path: str) -> None:
         """설정을 JSON 파일로 저장"""
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        json_utils.dump_file(self.to_dict(), json_path)
 
 # 기본 설정 가져오기 
 def get_default_config() -> AppConfig:
@@ -1,19 +1,62 @@
 # data/extended_schema_loader.py
-from typing import Dict, Any, Optional
-import json
+from typing import Dict, Any, Optional, TYPE_CHECKING
+import hashlib
 import logging
+import os
+import time
 from pathlib import Path
 
+import json_utils
 from data.schema_loader import SchemaLoader
-from data_catalog_connectors import DataCatalogConnector
+
+# 커넥터 모듈(requests 의존)은 타입 힌트에만 사용하므로 실행 시 임포트하지 않음
+if TYPE_CHECKING:
+    from data_catalog_connectors import DataCatalogConnector
 
 logger = logging.getLogger(__name__)
 
+# 카탈로그 스키마 디스크 캐시 디렉토리 (실행 위치와 무관하게 패키지 루트 기준)
+_CATALOG_CACHE_DIR = Path(__file__).resolve().parent.parent / "temp"
+_DEFAULT_CATALOG_CACHE_TTL = 3600.0
+
+def _parse_cache_ttl(value: Optional[str]) -> float:
+    """CATALOG_CACHE_TTL 환경 변수 값을 캐시 유효 시간(초)으로 변환
+    
+    값이 없거나 숫자가 아니면 기본값을 사용하고, 음수는 0(캐시 사용 안 함)으로 처리합니다.
+    """
+    if value is None or not value.strip():
+        return _DEFAULT_CATALOG_CACHE_TTL
+    try:
+        ttl = float(value)
+    except ValueError:
+        logger.warning(f"Invalid CATALOG_CACHE_TTL value {value!r}, using {_DEFAULT_CATALOG_CACHE_TTL}")
+        return _DEFAULT_CATALOG_CACHE_TTL
+    if ttl != ttl:  # NaN
+        return _DEFAULT_CATALOG_CACHE_TTL
+    return max(0.0, ttl)
+
+# 카탈로그 스키마 디스크 캐시 유효 시간(초)
+_CATALOG_CACHE_TTL = _parse_cache_ttl(os.environ.get("CATALOG_CACHE_TTL"))
+
+def catalog_cache_path(dataset_urn: str) -> Path:
+    """데이터셋 URN의 카탈로그 스키마 디스크 캐시 파일 경로 (URN 전체의 해시로 구분)"""
+    digest = hashlib.blake2b(dataset_urn.encode("utf-8"), digest_size=16).hexdigest()
+    return _CATALOG_CACHE_DIR / f"catalog_schema_{digest}.json"
+
+def clear_catalog_cache(dataset_urn: str) -> None:
+    """데이터셋 URN의 카탈로그 스키마 디스크 캐시 삭제 (없으면 무시)"""
+    try:
+        catalog_cache_path(dataset_urn).unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove catalog schema cache for {dataset_urn}: {e}")
+
 class ExtendedSchemaLoader(SchemaLoader):
     """외부 데이터 카탈로그에서 스키마를 로드할 수 있는 확장 스키마 로더"""
     
     def __init__(self, schema_path: Optional[str] = None, 
-                 data_catalog_connector: Optional[DataCatalogConnector] = None):
+                 data_catalog_connector: Optional["DataCatalogConnector"] = None):
         """
         Args:
             schema_path: 로컬 스키마 파일 경로
@@ -24,11 +67,12 @@ class ExtendedSchemaLoader(SchemaLoader):
         self.dataset_urn = None
         self.use_catalog = data_catalog_connector is not None
     
-    def load_schema_from_catalog(self, dataset_urn: str) -> Dict[str, Any]:
+    def load_schema_from_catalog(self, dataset_urn: str, force_refresh: bool = False) -> Dict[str, Any]:
         """데이터 카탈로그에서 스키마 로드
         
         Args:
             dataset_urn: 데이터셋 식별자
+            force_refresh: True이면 디스크 캐시를 무시하고 카탈로그에서 다시 가져옴
             
         Returns:
             스키마 정보 딕셔너리
@@ -36,38 +80,74 @@ class ExtendedSchemaLoader(SchemaLoader):
         if not self.data_catalog_connector:
             raise ValueError("Data catalog connector is not initialized")
         
+        cache_file = catalog_cache_path(dataset_urn)
+        
         try:
-            logger.info(f"Loading schema from data catalog for: {dataset_urn}")
+            # 디스크 캐시가 유효하면 카탈로그 호출 생략
+            internal_schema = None if force_refresh else self._read_catalog_cache(cache_file, dataset_urn)
             
-            # 데이터셋 스키마 가져오기
-            catalog_schema = self.data_catalog_connector.get_dataset_schema(dataset_urn)
-            
-            # 내부 형식으로 변환
-            internal_schema = self.data_catalog_connector.convert_to_internal_schema(catalog_schema)
+            if internal_schema is None:
+                logger.info(f"Loading schema from data catalog for: {dataset_urn}")
+                
+                # 데이터셋 스키마 가져오기
+                catalog_schema = self.data_catalog_connector.get_dataset_schema(dataset_urn)
+                
+                # 내부 형식으로 변환
+                internal_schema = self.data_catalog_connector.convert_to_internal_schema(catalog_schema)
+                
+                self._write_catalog_cache(cache_file, dataset_urn, internal_schema)
             
             # 캐싱
+            self._clear_format_cache()
             self.schema = internal_schema
             self.dataset_urn = dataset_urn
             
-            # 디버깅을 위해 파일로 저장 (선택적)
-            try:
-                temp_dir = Path("temp")
-                temp_dir.mkdir(exist_ok=True)
-                
-                schema_file = temp_dir / f"catalog_schema_{dataset_urn.split(':')[-1]}.json"
-                with open(schema_file, 'w', encoding='utf-8') as f:
-                    json.dump(internal_schema, f, indent=2, ensure_ascii=False)
-                
-                logger.info(f"Saved catalog schema to: {schema_file}")
-            except Exception as e:
-                logger.warning(f"Failed to save catalog schema to file: {e}")
-            
             return internal_schema
             
         except Exception as e:
             logger.error(f"Error loading schema from catalog: {e}")
             raise
     
+    def invalidate(self, dataset_urn: str) -> None:
+        """데이터셋 URN의 커넥터 메모리 캐시와 디스크 스키마 캐시를 모두 삭제 (데이터셋 변경을 알게 된 경우 호출)"""
+        if self.data_catalog_connector:
+            self.data_catalog_connector.invalidate(dataset_urn)
+        clear_catalog_cache(dataset_urn)
+    
+    @staticmethod
+    def _read_catalog_cache(cache_file: Path, dataset_urn: str) -> Optional[Dict[str, Any]]:
+        """디스크에 저장된 카탈로그 스키마 로드
+        
+        Returns:
+            캐시가 없거나 만료되었거나 다른 URN의 캐시인 경우 None
+        """
+        try:
+            if time.time() - cache_file.stat().st_mtime >= _CATALOG_CACHE_TTL:
+                return None
+            cached = json_utils.load_file(cache_file)
+        except (OSError, json_utils.JSONDecodeError):
+            return None
+        
+        # 이전 형식(스키마만 저장)이거나 다른 URN의 캐시는 무시
+        if not isinstance(cached, dict) or cached.get("urn") != dataset_urn or "schema" not in cached:
+            return None
+        
+        logger.info(f"Loaded catalog schema from cache: {cache_file}")
+        return cached["schema"]
+    
+    @staticmethod
+    def _write_catalog_cache(cache_file: Path, dataset_urn: str, internal_schema: Dict[str, Any]) -> None:
+        """카탈로그 스키마를 디스크 캐시에 저장 (실패해도 로드는 계속 진행)"""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            json_utils.dump_file(
+                {"urn": dataset_urn, "fetched_at": time.time(), "schema": internal_schema},
+                cache_file
+            )
+            logger.info(f"Saved catalog schema to: {cache_file}")
+        except Exception as e:
+            logger.warning(f"Failed to save catalog schema to file: {e}")
+    
     def load_schema(self) -> Dict[str, Any]:
         """파일 또는 데이터 카탈로그에서 스키마 로드
         
@@ -86,12 +166,30 @@ class ExtendedSchemaLoader(SchemaLoader):
         return super().load_schema()
     
     def get_schema_summary(self) -> str:
-        """스키마 정보 요약 문자열 생성"""
+        """스키마 정보 요약 문자열 생성
+        
+        테이블/컬럼 요약은 부모 클래스의 요약 캐시 슬롯에 저장해 재사용하고,
+        호출 시점에 따라 달라질 수 있는 출처 정보만 매번 덧붙입니다.
+        """
         schema = self.load_schema()
         
         if not schema:
             return "스키마 정보가 없습니다."
         
+        if self._summary_cache is None:
+            self._summary_cache = self._build_table_summary(schema)
+        
+        # 출처 정보 추가
+        if self.use_catalog and self.dataset_urn:
+            source = f"출처: 데이터 카탈로그 (URN: {self.dataset_urn})"
+        else:
+            source = f"출처: 로컬 파일 ({self.schema_path})"
+        
+        return f"{self._summary_cache}\n\n{source}"
+    
+    @staticmethod
+    def _build_table_summary(schema: Dict[str, Any]) -> str:
+        """데이터베이스/테이블/컬럼 요약 문자열 생성 (출처 정보 제외)"""
         summary = []
         
         # 데이터베이스 이름
@@ -118,10 +216,4 @@ class ExtendedSchemaLoader(SchemaLoader):
                 if len(columns) > 5:
                     summary.append(f"외 {len(columns) - 5}개 컬럼")
         
-        # 출처 정보 추가
-        if self.use_catalog and self.dataset_urn:
-            summary.append(f"\n출처: 데이터 카탈로그 (URN: {self.dataset_urn})")
-        else:
-            summary.append(f"\n출처: 로컬 파일 ({self.schema_path})")
-        
-        return "\n".join(summary)
\ No newline at end of file
+        return "\n".join(summary)
@@ -1,26 +1,37 @@
-import json
-import os
-import csv
 import random
-from typing import Dict, List, Any, Optional, Union
+import sys
+from typing import Dict, Iterable, List, Any, Optional, Union
 from pathlib import Path
-import pandas as pd
+
+import json_utils
+
+# csv, openpyxl, pandas는 무거운 임포트를 피하기 위해 필요한 메서드 안에서 임포트
 
 class QALoader:
     """Q&A 데이터 로드 및 처리를 위한 클래스"""
     
-    def __init__(self, qa_path: Optional[Union[str, Path]] = None):
+    # 요청한 난이도의 데이터가 없을 때 대체할 난이도 순서
+    _FALLBACK_CHAIN = {
+        "easy": ("easy", "medium", "hard"),
+        "medium": ("medium", "easy", "hard"),
+        "hard": ("hard", "medium", "easy")
+    }
+    
+    def __init__(self, qa_path: Optional[Union[str, Path]] = None, seed: Optional[int] = None):
         """
         Args:
             qa_path: Q&A 데이터 파일 경로 (JSON, CSV 등)
+            seed: 예제 샘플링용 난수 시드 (재현 가능한 결과가 필요한 경우)
         """
         self.qa_path = Path(qa_path) if qa_path else None
+        self._rng = random.Random(seed)
         self.qa_data = []
         self.by_difficulty = {
             "easy": [],
             "medium": [],
             "hard": []
         }
+        self._effective_pool = dict(self.by_difficulty)
     
     def load_qa_data(self) -> List[Dict[str, Any]]:
         """Q&A 데이터 파일 로드 및 파싱
@@ -54,111 +65,127 @@ class QALoader:
         except Exception as e:
             raise ValueError(f"Q&A 데이터 파일 로드 실패: {str(e)}")
         
-        # 난이도별 데이터 분류
-        self._categorize_by_difficulty()
-        
         return self.qa_data
     
     def _load_from_json(self) -> None:
         """JSON 파일에서 Q&A 데이터 로드"""
-        with open(self.qa_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = json_utils.load_file(self.qa_path)
         
         # JSON 형식이 배열인지 확인
         if isinstance(data, list):
-            self.qa_data = data
+            items = data
         elif isinstance(data, dict) and 'qa_data' in data:
             # {'qa_data': [...]} 형식인 경우
-            self.qa_data = data['qa_data']
+            items = data['qa_data']
         else:
             raise ValueError("JSON 파일이 유효한 Q&A 데이터 형식이 아닙니다.")
         
-        # 필수 필드 확인
-        self._validate_qa_data()
+        # 필수 필드 확인 및 난이도별 분류
+        self._ingest_items(items)
     
     def _load_from_csv(self) -> None:
         """CSV 파일에서 Q&A 데이터 로드"""
-        # CSV 파일 읽기
-        df = pd.read_csv(self.qa_path, encoding='utf-8')
-        
-        # 필수 필드 확인
-        required_columns = ['question', 'answer']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            raise ValueError(f"CSV 파일에 필수 컬럼이 누락되었습니다: {', '.join(missing_columns)}")
-        
-        # 데이터프레임을 딕셔너리 리스트로 변환
-        self.qa_data = df.to_dict(orient='records')
+        import csv
         
-        # SQL 필드가 없는 경우 빈 문자열로 설정
-        for item in self.qa_data:
-            if 'sql' not in item or pd.isna(item['sql']):
-                item['sql'] = ''
+        # CSV 파일 읽기 (BOM이 있는 파일도 처리)
+        with open(self.qa_path, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
             
-            if 'difficulty' not in item or pd.isna(item['difficulty']):
-                item['difficulty'] = 'medium'  # 기본 난이도
+            # 필수 필드 확인
+            self._check_required_columns(reader.fieldnames or [], "CSV")
+            
+            # 행을 딕셔너리로 읽으면서 기본값 설정 및 난이도별 분류
+            # (DictReader의 행에는 헤더의 모든 키가 있으므로 행별 필수 필드 확인 생략)
+            self._ingest_items(reader, check_required=False)
     
     def _load_from_excel(self) -> None:
         """Excel 파일에서 Q&A 데이터 로드"""
-        # Excel 파일 읽기
-        df = pd.read_excel(self.qa_path)
+        from openpyxl import load_workbook
         
-        # 필수 필드 확인
+        # Excel 파일 읽기 (읽기 전용 모드로 메모리 사용 최소화)
+        workbook = load_workbook(self.qa_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None) or ()
+            columns = ['' if name is None else str(name) for name in header]
+            
+            # 필수 필드 확인
+            self._check_required_columns(columns, "Excel")
+            
+            # 빈 행은 건너뛰고 행을 딕셔너리로 변환하면서 검증 및 난이도별 분류
+            self._ingest_items(
+                dict(zip(columns, row))
+                for row in rows
+                if any(value is not None for value in row)
+            )
+        finally:
+            workbook.close()
+    
+    @staticmethod
+    def _check_required_columns(columns: List[str], file_type: str) -> None:
+        """필수 컬럼 존재 여부 확인
+        
+        Raises:
+            ValueError: 필수 컬럼이 누락된 경우
+        """
         required_columns = ['question', 'answer']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing_columns = [col for col in required_columns if col not in columns]
         if missing_columns:
-            raise ValueError(f"Excel 파일에 필수 컬럼이 누락되었습니다: {', '.join(missing_columns)}")
-        
-        # 데이터프레임을 딕셔너리 리스트로 변환
-        self.qa_data = df.to_dict(orient='records')
-        
-        # SQL 필드가 없는 경우 빈 문자열로 설정
-        for item in self.qa_data:
-            if 'sql' not in item or pd.isna(item['sql']):
-                item['sql'] = ''
-            
-            if 'difficulty' not in item or pd.isna(item['difficulty']):
-                item['difficulty'] = 'medium'  # 기본 난이도
+            raise ValueError(f"{file_type} 파일에 필수 컬럼이 누락되었습니다: {', '.join(missing_columns)}")
     
-    def _validate_qa_data(self) -> None:
-        """Q&A 데이터 형식 검증
+    def _ingest_items(self, items: Iterable[Dict[str, Any]], check_required: bool = True) -> None:
+        """Q&A 항목 검증, 기본값 설정, 난이도별 분류를 한 번의 순회로 수행
         
+        Args:
+            items: 로드된 Q&A 항목 (리스트 또는 이터러블)
+            check_required: 항목별 필수 필드 확인 여부 (컬럼 단위로 이미 확인한 경우 False)
+            
         Raises:
             ValueError: 데이터 형식이 잘못된 경우
         """
-        for i, item in enumerate(self.qa_data):
+        qa_data = []
+        by_difficulty = {
+            "easy": [],
+            "medium": [],
+            "hard": []
+        }
+        
+        for i, item in enumerate(items):
             # 필수 필드 확인
-            if 'question' not in item:
-                raise ValueError(f"항목 #{i+1}에 'question' 필드가 누락되었습니다.")
-            if 'answer' not in item:
-                raise ValueError(f"항목 #{i+1}에 'answer' 필드가 누락되었습니다.")
+            if check_required:
+                if 'question' not in item:
+                    raise ValueError(f"항목 #{i+1}에 'question' 필드가 누락되었습니다.")
+                if 'answer' not in item:
+                    raise ValueError(f"항목 #{i+1}에 'answer' 필드가 누락되었습니다.")
             
             # SQL 필드가 없는 경우 빈 문자열로 설정
-            if 'sql' not in item:
+            if item.get('sql') is None:
                 item['sql'] = ''
             
             # 난이도 필드가 없는 경우 기본값 설정
-            if 'difficulty' not in item:
+            difficulty = item.get('difficulty')
+            if difficulty in (None, ''):
                 item['difficulty'] = 'medium'  # 기본 난이도
-    
-    def _categorize_by_difficulty(self) -> None:
-        """Q&A 데이터를 난이도별로 분류"""
-        # 난이도별 분류 초기화
-        self.by_difficulty = {
-            "easy": [],
-            "medium": [],
-            "hard": []
-        }
-        
-        # 각 항목을 난이도별로 분류
-        for item in self.qa_data:
-            difficulty = item.get('difficulty', 'medium').lower()
+            elif isinstance(difficulty, str):
+                # 항목마다 반복되는 난이도 문자열은 공유 객체로 저장 (메모리 절약)
+                item['difficulty'] = sys.intern(difficulty)
             
-            # 지원되지 않는 난이도는 중간으로 설정
-            if difficulty not in self.by_difficulty:
-                difficulty = 'medium'
+            # 지원되지 않는 난이도는 중간으로 분류
+            bucket = by_difficulty.get(str(item['difficulty']).lower())
+            if bucket is None:
+                bucket = by_difficulty['medium']
             
-            self.by_difficulty[difficulty].append(item)
+            qa_data.append(item)
+            bucket.append(item)
+        
+        self.qa_data = qa_data
+        self.by_difficulty = by_difficulty
+        
+        # 난이도별 실제 샘플링 대상 (비어 있으면 대체 순서에 따라 다른 난이도 사용)
+        self._effective_pool = {
+            difficulty: next((by_difficulty[alt] for alt in chain if by_difficulty[alt]), [])
+            for difficulty, chain in self._FALLBACK_CHAIN.items()
+        }
     
     def get_examples_by_difficulty(
         self, 
@@ -178,30 +205,36 @@ class QALoader:
             self.load_qa_data()
         
         difficulty = difficulty.lower()
-        if difficulty not in self.by_difficulty:
+        if difficulty not in self._effective_pool:
             raise ValueError(f"지원되지 않는 난이도입니다: {difficulty}")
         
-        # 해당 난이도의 데이터가 충분히 있는지 확인
-        available = self.by_difficulty[difficulty]
-        if not available:
-            # 다른 난이도에서 대체
-            for alt_difficulty in ['medium', 'easy', 'hard']:
-                if self.by_difficulty[alt_difficulty]:
-                    available = self.by_difficulty[alt_difficulty]
-                    break
+        # 해당 난이도의 데이터가 없으면 로드 시 계산해 둔 대체 난이도 데이터 사용
+        available = self._effective_pool[difficulty]
         
         # 요청된 수만큼 무작위로 선택 (중복 없이)
         sample_count = min(count, len(available))
         if sample_count == 0:
             return []
         
-        return random.sample(available, sample_count)
+        # 소량 요청(일반적으로 3개 이하)은 인덱스를 직접 뽑아 중복만 제거
+        if sample_count <= 3:
+            randrange = self._rng.randrange
+            population = len(available)
+            picked_indexes = []
+            while len(picked_indexes) < sample_count:
+                index = randrange(population)
+                if index not in picked_indexes:
+                    picked_indexes.append(index)
+            return [available[index] for index in picked_indexes]
+        
+        return self._rng.sample(available, sample_count)
     
     def save_qa_data(
         self, 
         data: List[Dict[str, Any]], 
         output_path: Union[str, Path],
-        format: str = 'json'
+        format: str = 'json',
+        indent: bool = True
     ) -> None:
         """Q&A 데이터를 파일로 저장
         
@@ -209,6 +242,7 @@ class QALoader:
             data: 저장할 Q&A 데이터
             output_path: 출력 파일 경로
             format: 출력 형식 ('json', 'csv', 'excel')
+            indent: JSON 들여쓰기 여부 (False이면 공백 없는 압축 형식으로 저장)
             
         Raises:
             ValueError: 지원되지 않는 출력 형식인 경우
@@ -223,15 +257,18 @@ class QALoader:
         # 형식에 따라 저장
         format = format.lower()
         if format == 'json':
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            json_utils.dump_file(data, output_path, indent=indent)
                 
         elif format == 'csv':
+            import pandas as pd
+            
             # 데이터프레임으로 변환 후 CSV로 저장
             df = pd.DataFrame(data)
             df.to_csv(output_path, index=False, encoding='utf-8')
             
         elif format == 'excel':
+            import pandas as pd
+            
             # 데이터프레임으로 변환 후 Excel로 저장
             df = pd.DataFrame(data)
             df.to_excel(output_path, index=False)
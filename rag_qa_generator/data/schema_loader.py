@@ -1,9 +1,29 @@
-import json
 import os
-from typing import Dict, List, Optional, Any, Union
+import sys
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple, Union
 from pathlib import Path
 import re
 
+import json_utils
+
+# 스키마 파일 원본 캐시: (절대 경로, mtime_ns, 파일 크기) -> 파일 바이트
+# bytes는 불변이므로 인스턴스 간에 공유해도 안전하며, 파싱 결과는 인스턴스마다 새로 생성합니다.
+_SCHEMA_CACHE: "OrderedDict[Tuple[str, int, int], bytes]" = OrderedDict()
+_SCHEMA_CACHE_MAXSIZE = 32
+
+class _TableColumns(NamedTuple):
+    """프롬프트 포맷팅용 테이블별 컬럼 속성 (불변, 로더 인스턴스/스레드 간 공유)"""
+    names: Tuple[str, ...]
+    types: Tuple[str, ...]
+    primary_keys: Tuple[bool, ...]
+    not_nulls: Tuple[bool, ...]
+    foreign_keys: Tuple[Tuple[str, str, str], ...]  # (컬럼, 참조 테이블, 참조 컬럼)
+
+def _intern(value: Any) -> Any:
+    """문자열이면 sys.intern으로 공유 객체 반환 (반복되는 타입명/이름의 메모리 절약)"""
+    return sys.intern(value) if isinstance(value, str) else value
+
 class SchemaLoader:
     """데이터베이스 스키마 파일 로드 및 처리를 위한 클래스"""
     
@@ -16,6 +36,14 @@ class SchemaLoader:
         self.schema = None
         self.tables = {}
         self.references = {}
+        
+        # 테이블별 컬럼 속성 배열: 테이블명 -> (이름, 타입, 기본키 여부, NOT NULL 여부)
+        self._table_cols = {}
+        
+        # 포맷팅 결과 캐시 (스키마 파일이 변경되어 다시 로드되면 초기화)
+        self._prompt_cache = {}
+        self._summary_cache = None
+        self._loaded_key = None
     
     def load_schema(self) -> Dict[str, Any]:
         """스키마 파일 로드 및 검증
@@ -27,15 +55,32 @@ class SchemaLoader:
             FileNotFoundError: 스키마 파일이 존재하지 않는 경우
             ValueError: 스키마 파일 형식이 잘못된 경우
         """
-        # 파일 존재 여부 확인
-        if not self.schema_path.exists():
+        # 파일 존재 여부 확인 (stat 한 번으로 존재 확인과 캐시 키 계산을 함께 처리)
+        try:
+            stat = self.schema_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"스키마 파일이 존재하지 않습니다: {self.schema_path}")
         
-        # 파일 로드
+        # 캐시 확인 (파일이 변경되지 않았으면 파일 읽기 생략)
+        cache_key = (str(self.schema_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        raw = _SCHEMA_CACHE.get(cache_key)
+        if raw is not None:
+            _SCHEMA_CACHE.move_to_end(cache_key)
+        else:
+            raw = self.schema_path.read_bytes()
+            # 캐시에 저장 (최대 크기 초과 시 가장 오래된 항목 제거)
+            _SCHEMA_CACHE[cache_key] = raw
+            while len(_SCHEMA_CACHE) > _SCHEMA_CACHE_MAXSIZE:
+                _SCHEMA_CACHE.popitem(last=False)
+        
+        # 파일이 변경된 경우에만 포맷팅 결과 캐시 초기화
+        if cache_key != self._loaded_key:
+            self._clear_format_cache()
+        
+        # 파싱
         try:
-            with open(self.schema_path, 'r', encoding='utf-8') as f:
-                self.schema = json.load(f)
-        except json.JSONDecodeError as e:
+            self.schema = json_utils.loads(raw)
+        except json_utils.JSONDecodeError as e:
             raise ValueError(f"스키마 파일 형식이 잘못되었습니다: {str(e)}")
         
         # 스키마 검증
@@ -43,9 +88,16 @@ class SchemaLoader:
         
         # 테이블 및 참조 정보 추출
         self._extract_tables_and_references()
+        self._loaded_key = cache_key
         
         return self.schema
     
+    def _clear_format_cache(self) -> None:
+        """format_for_prompt / get_schema_summary 캐시 초기화"""
+        self._prompt_cache.clear()
+        self._summary_cache = None
+        self._loaded_key = None
+    
     def _validate_schema(self) -> None:
         """스키마 형식 검증
         
@@ -81,16 +133,32 @@ class SchemaLoader:
         if not self.schema:
             return
         
+        # 재로드 시 이전 결과가 누적되지 않도록 초기화
+        self.tables = {}
+        self.references = {}
+        self._table_cols = {}
+        
         # 테이블 정보 추출
         for table in self.schema["tables"]:
-            table_name = table["name"]
+            # 테이블/컬럼 이름과 타입은 반복이 많으므로 인터닝
+            table_name = table["name"] = _intern(table["name"])
             self.tables[table_name] = table
             
+            # 프롬프트 포맷팅용 컬럼 속성 배열 구성
+            names, types, primary_keys, not_nulls, foreign_keys = [], [], [], [], []
+            
             # 외래 키 참조 추출
             for column in table["columns"]:
+                column_name = column["name"] = _intern(column["name"])
+                column_type = column["type"] = _intern(column["type"])
+                names.append(column_name)
+                types.append(column_type)
+                primary_keys.append(bool(column.get("primary_key")))
+                not_nulls.append(bool(column.get("not_null")))
+                
                 if "references" in column:
-                    ref_table = column["references"].get("table")
-                    ref_column = column["references"].get("column")
+                    ref_table = _intern(column["references"].get("table"))
+                    ref_column = _intern(column["references"].get("column"))
                     
                     if ref_table and ref_column:
                         # 참조 정보 저장
@@ -98,10 +166,15 @@ class SchemaLoader:
                             self.references[table_name] = []
                         
                         self.references[table_name].append({
-                            "column": column["name"],
+                            "column": column_name,
                             "ref_table": ref_table,
                             "ref_column": ref_column
                         })
+                        foreign_keys.append((column_name, ref_table, ref_column))
+            
+            self._table_cols[table_name] = _TableColumns(
+                tuple(names), tuple(types), tuple(primary_keys), tuple(not_nulls), tuple(foreign_keys)
+            )
     
     def get_tables(self) -> Dict[str, Any]:
         """테이블 정보 반환
@@ -169,45 +242,41 @@ class SchemaLoader:
         if not self.schema:
             self.load_schema()
         
-        formatted_schema = []
+        cached = self._prompt_cache.get(include_relationships)
+        if cached is not None:
+            return cached
+        
+        # 전체 스키마를 하나의 줄 목록에 기록 (테이블 사이는 빈 줄로 구분)
+        lines = []
+        append = lines.append
         
         # 각 테이블 정보 포맷팅
-        for table_name, table in self.tables.items():
-            table_info = [f"Table: {table_name}"]
+        for table_name, cols in self._table_cols.items():
+            if lines:
+                append("")
+            append(f"Table: {table_name}")
             
             # 컬럼 정보 추가
-            columns_info = []
-            for column in table["columns"]:
-                col_name = column["name"]
-                col_type = column["type"]
-                is_primary = column.get("primary_key", False)
-                is_nullable = not column.get("not_null", False)
-                
-                # 컬럼 정보 문자열 구성
-                col_info = f"{col_name} ({col_type})"
-                if is_primary:
-                    col_info += " PRIMARY KEY"
-                if not is_nullable:
-                    col_info += " NOT NULL"
-                
-                columns_info.append(col_info)
-            
-            # 테이블에 컬럼 정보 추가
-            table_info.append("Columns:")
-            table_info.extend([f"  - {col}" for col in columns_info])
+            append("Columns:")
+            lines.extend(
+                f"  - {name} ({col_type})"
+                f"{' PRIMARY KEY' if is_primary else ''}"
+                f"{' NOT NULL' if is_not_null else ''}"
+                for name, col_type, is_primary, is_not_null
+                in zip(cols.names, cols.types, cols.primary_keys, cols.not_nulls)
+            )
             
             # 관계 정보 추가 (요청된 경우)
-            if include_relationships and table_name in self.references:
-                table_info.append("Foreign Keys:")
-                for ref in self.references[table_name]:
-                    ref_info = f"  - {ref['column']} references {ref['ref_table']}({ref['ref_column']})"
-                    table_info.append(ref_info)
-            
-            # 테이블 구분선 추가
-            formatted_schema.append("\n".join(table_info))
+            if include_relationships and cols.foreign_keys:
+                append("Foreign Keys:")
+                lines.extend(
+                    f"  - {column} references {ref_table}({ref_column})"
+                    for column, ref_table, ref_column in cols.foreign_keys
+                )
         
-        # 전체 스키마 조합
-        return "\n\n".join(formatted_schema)
+        formatted_schema = "\n".join(lines)
+        self._prompt_cache[include_relationships] = formatted_schema
+        return formatted_schema
     
     def get_schema_summary(self) -> str:
         """스키마 요약 정보 생성
@@ -218,6 +287,9 @@ class SchemaLoader:
         if not self.schema:
             self.load_schema()
         
+        if self._summary_cache is not None:
+            return self._summary_cache
+        
         summary = []
         
         # 데이터베이스 이름 추가 (있는 경우)
@@ -236,4 +308,5 @@ class SchemaLoader:
         relation_count = sum(len(refs) for refs in self.references.values())
         summary.append(f"Relationships: {relation_count}")
         
-        return "\n".join(summary)
\ No newline at end of file
+        self._summary_cache = "\n".join(summary)
+        return self._summary_cache
\ No newline at end of file
@@ -1,24 +1,126 @@
 # data_catalog_connectors.py
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import re
 import time
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple, TypedDict
 from abc import ABC, abstractmethod
 import logging
 
+import json_utils
+
+# 비동기 HTTP 클라이언트 (선택)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# 대용량 응답 스트리밍 파서 (선택)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# URN의 첫 번째 쉼표 이전 구간에서 플랫폼 이름 추출
+# 예: urn:li:dataset:(urn:li:dataPlatform:mysql,mydb.schema.table,PROD) -> mysql
+_PLATFORM_RE = re.compile(r'^[^,]*?dataPlatform:([^,]*)')
+
+# 컬럼 속성으로 변환할 DataHub 태그 비트 (bit0: 기본 키, bit1: NOT NULL)
+_TAG_BITS = {"primaryKey": 1, "nonnull": 2}
+_ALL_TAG_BITS = 3
+
+# 이 크기(바이트)를 넘는 목록 응답은 ijson으로 스트리밍 파싱
+_STREAMING_THRESHOLD = 1024 * 1024
+
+# 비동기 요청에서 이 크기(바이트) 이상인 응답은 별도 스레드에서 파싱
+_THREAD_DECODE_THRESHOLD = 64 * 1024
+
+class InternalColumn(TypedDict):
+    """내부 스키마 형식의 컬럼 정보"""
+    name: str
+    type: str
+    description: str
+    primary_key: bool
+    not_null: bool
+
+class InternalIndex(TypedDict):
+    """내부 스키마 형식의 인덱스 정보"""
+    name: str
+    type: str
+    columns: str  # 쉼표로 구분된 컬럼 이름
+    description: str
+
+class InternalTable(TypedDict):
+    """내부 스키마 형식의 테이블 정보"""
+    name: str
+    description: str
+    columns: List[InternalColumn]
+    indexes: List[InternalIndex]
+    relationships: List[Dict[str, Any]]
+
+class InternalSchema(TypedDict):
+    """내부 스키마 형식 (SchemaLoader가 읽는 JSON 구조와 동일)"""
+    database_name: str
+    tables: List[InternalTable]
+
 class DataCatalogConnector(ABC):
     """데이터 카탈로그 연결을 위한 기본 추상 클래스"""
     
+    __slots__ = (
+        "base_url", "api_token", "timeout",
+        "cache", "cache_ttl", "cache_maxsize", "_cache_deps",
+        "_session", "_async_client"
+    )
+    
     def __init__(self, base_url: str, api_token: str, timeout: int = 30):
         self.base_url = base_url.rstrip('/')
         self.api_token = api_token
         self.timeout = timeout
-        self.cache = {}  # 간단한 메모리 캐시
+        self.cache = OrderedDict()  # 메모리 캐시: 키 -> (저장 시각, 데이터, 의존 URN 목록)
         self.cache_ttl = 300  # 캐시 TTL (초)
-        self.cache_timestamp = {}
+        self.cache_maxsize = 1024  # 최대 캐시 항목 수 (초과 시 가장 오래된 항목 제거)
+        self._cache_deps: Dict[str, Set[str]] = {}  # 데이터셋 URN -> 해당 URN에 의존하는 캐시 키
+        
+        # 같은 호스트에 대한 반복 요청에서 연결을 재사용하기 위한 세션
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json"
+        })
+        # 일시적 오류(요청 한도 초과, 5xx)는 연결 계층에서 백오프 후 자동 재시도
+        # (POST는 GraphQL 변경 요청처럼 멱등이 아닐 수 있으므로 재전송하지 않고 GET만 재시도)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
+        # 비동기 요청용 클라이언트 (처음 사용할 때 생성)
+        self._async_client = None
+    
+    def close(self) -> None:
+        """HTTP 세션 및 연결 풀 종료"""
+        self._session.close()
+    
+    async def aclose(self) -> None:
+        """비동기 HTTP 클라이언트 종료"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
     
     @abstractmethod
     def list_datasets(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
@@ -31,68 +133,177 @@ class DataCatalogConnector(ABC):
         pass
     
     @abstractmethod
-    def convert_to_internal_schema(self, external_schema: Dict[str, Any]) -> Dict[str, Any]:
+    def convert_to_internal_schema(self, external_schema: Dict[str, Any]) -> InternalSchema:
         """외부 스키마를 내부 스키마 형식으로 변환"""
         pass
     
     def _get_from_cache(self, key: str) -> Optional[Any]:
         """캐시에서 데이터 가져오기"""
-        if key in self.cache:
-            # 캐시 TTL 확인
-            if time.time() - self.cache_timestamp.get(key, 0) < self.cache_ttl:
-                logger.debug(f"Cache hit for key: {key}")
-                return self.cache[key]
-            else:
-                # 캐시 만료
-                del self.cache[key]
-                if key in self.cache_timestamp:
-                    del self.cache_timestamp[key]
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, data, _ = entry
+        # 캐시 TTL 확인
+        if time.monotonic() - stored_at < self.cache_ttl:
+            logger.debug(f"Cache hit for key: {key}")
+            return data
+        
+        # 캐시 만료
+        self._evict_cache_key(key)
         return None
     
-    def _store_in_cache(self, key: str, data: Any) -> None:
-        """데이터를 캐시에 저장"""
-        self.cache[key] = data
-        self.cache_timestamp[key] = time.time()
+    def _store_in_cache(self, key: str, data: Any, dep_keys: Tuple[str, ...] = ()) -> None:
+        """데이터를 캐시에 저장
+        
+        Args:
+            key: 캐시 키
+            data: 저장할 데이터
+            dep_keys: 이 항목이 의존하는 데이터셋 URN (invalidate 호출 시 함께 제거)
+        """
+        if key in self.cache:
+            self._evict_cache_key(key)
+        self.cache[key] = (time.monotonic(), data, dep_keys)
+        for dep in dep_keys:
+            self._cache_deps.setdefault(dep, set()).add(key)
+        
+        while len(self.cache) > self.cache_maxsize:
+            self._evict_cache_key(next(iter(self.cache)))
         logger.debug(f"Stored in cache: {key}")
     
+    def _evict_cache_key(self, key: str) -> None:
+        """캐시 항목과 해당 항목의 URN 의존 정보 제거"""
+        entry = self.cache.pop(key, None)
+        if entry is None:
+            return
+        for dep in entry[2]:
+            keys = self._cache_deps.get(dep)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._cache_deps[dep]
+    
+    def invalidate(self, dataset_urn: str) -> None:
+        """특정 데이터셋 URN에 의존하는 메모리 캐시 항목만 제거 (데이터셋 변경을 알게 된 경우 호출)
+        
+        디스크 스키마 캐시까지 지우려면 ExtendedSchemaLoader.invalidate를 사용합니다.
+        """
+        for key in list(self._cache_deps.get(dataset_urn, ())):
+            self._evict_cache_key(key)
+        logger.debug(f"Invalidated cache for: {dataset_urn}")
+    
     def _make_api_request(self, endpoint: str, method: str = "GET", 
                           params: Optional[Dict[str, Any]] = None, 
                           data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """API 요청 수행"""
+        response = self._send_request(endpoint, method, params=params, data=data)
+        
+        # orjson이 설치되어 있으면 응답 바이트를 바로 파싱
+        return json_utils.loads(response.content)
+    
+    def _iter_api_items(self, endpoint: str, key: str,
+                        params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """GET 응답의 최상위 배열 필드(key) 항목을 순회
+        
+        응답이 크고 ijson을 사용할 수 있으면 전체 응답을 메모리에 올리지 않고
+        항목 단위로 스트리밍 파싱합니다.
+        """
+        response = self._send_request(endpoint, params=params, stream=True)
+        try:
+            content_length = int(response.headers.get("Content-Length") or 0)
+            if IJSON_AVAILABLE and content_length > _STREAMING_THRESHOLD:
+                # 압축된 응답도 풀어서 읽도록 설정
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, f"{key}.item", use_float=True)
+            else:
+                yield from json_utils.loads(response.content).get(key, [])
+        finally:
+            response.close()
+    
+    def _send_request(self, endpoint: str, method: str = "GET",
+                      params: Optional[Dict[str, Any]] = None,
+                      data: Optional[Dict[str, Any]] = None,
+                      stream: bool = False) -> "requests.Response":
+        """HTTP 요청 전송 및 오류 응답을 전용 예외로 변환"""
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json"
-        }
         
         try:
+            # 인증/Content-Type 헤더는 세션에 설정되어 있음
             if method.upper() == "GET":
-                response = requests.get(url, headers=headers, params=params, timeout=self.timeout)
+                response = self._session.get(url, params=params, timeout=self.timeout, stream=stream)
             elif method.upper() == "POST":
-                response = requests.post(url, headers=headers, json=data, timeout=self.timeout)
+                body = json_utils.dumps_bytes(data) if data is not None else None
+                response = self._session.post(url, data=body, timeout=self.timeout, stream=stream)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            # 응답 상태 확인
-            response.raise_for_status()
-            
-            return response.json()
-        
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 401:
-                raise AuthenticationError("API 인증 실패. 토큰을 확인하세요.")
-            elif response.status_code == 403:
-                raise PermissionError("API 접근 권한이 없습니다.")
-            elif response.status_code == 429:
-                raise RateLimitError("API 요청 한도 초과. 잠시 후 다시 시도하세요.")
-            else:
-                logger.error(f"HTTP error: {e}")
-                raise
+        
         except requests.exceptions.Timeout:
             raise TimeoutError(f"API 요청 타임아웃 ({self.timeout}초)")
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error: {e}")
             raise ConnectionError(f"API 연결 오류: {str(e)}")
+        
+        # 응답 상태 확인 (재시도 후에도 실패한 경우에만 상태 코드별 처리)
+        if not response.ok:
+            self._raise_for_status_code(response.status_code)
+            logger.error(f"HTTP error: {response.status_code} {response.reason} for url: {response.url}")
+            response.raise_for_status()
+        
+        return response
+    
+    @staticmethod
+    def _raise_for_status_code(status_code: int) -> None:
+        """인증/권한/요청 한도 관련 HTTP 상태 코드를 전용 예외로 변환"""
+        if status_code == 401:
+            raise AuthenticationError("API 인증 실패. 토큰을 확인하세요.")
+        elif status_code == 403:
+            raise PermissionError("API 접근 권한이 없습니다.")
+        elif status_code == 429:
+            # 세션 요청은 재시도를 모두 소진한 뒤에만 여기에 도달
+            raise RateLimitError("API 요청 한도 초과. 잠시 후 다시 시도하세요.")
+    
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """연결 풀을 공유하는 비동기 HTTP 클라이언트 반환"""
+        if not HTTPX_AVAILABLE:
+            raise ImportError("비동기 요청을 사용하려면 httpx 패키지가 필요합니다. 'pip install httpx'로 설치하세요.")
+        
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers={
+                    "Authorization": f"Bearer {self.api_token}",
+                    "Content-Type": "application/json"
+                },
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=self.timeout
+            )
+        return self._async_client
+    
+    async def _amake_api_request(self, endpoint: str,
+                                 params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """비동기 GET API 요청 수행 (예외 처리는 _make_api_request와 동일)"""
+        url = f"{self.base_url}{endpoint}"
+        client = self._get_async_client()
+        
+        try:
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            
+            # 큰 응답은 이벤트 루프를 막지 않도록 스레드에서 파싱
+            body = response.content
+            if len(body) < _THREAD_DECODE_THRESHOLD:
+                return json_utils.loads(body)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, json_utils.loads, body)
+        
+        except httpx.HTTPStatusError as e:
+            self._raise_for_status_code(e.response.status_code)
+            logger.error(f"HTTP error: {e}")
+            raise
+        except httpx.TimeoutException:
+            raise TimeoutError(f"API 요청 타임아웃 ({self.timeout}초)")
+        except httpx.RequestError as e:
+            logger.error(f"Request error: {e}")
+            raise ConnectionError(f"API 연결 오류: {str(e)}")
 
 # 예외 클래스 정의
 class AuthenticationError(Exception):
@@ -107,6 +318,8 @@ class RateLimitError(Exception):
 class DatahubConnector(DataCatalogConnector):
     """DataHub API와 연동하여 스키마 정보를 가져오는 클래스"""
     
+    __slots__ = ()
+    
     def list_datasets(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """데이터셋 목록 가져오기"""
         cache_key = f"datahub_datasets_{limit}_{offset}"
@@ -114,24 +327,8 @@ class DatahubConnector(DataCatalogConnector):
         if cached_data:
             return cached_data
         
-        params = {
-            "limit": limit,
-            "offset": offset,
-            "type": "DATASET"
-        }
-        
-        result = self._make_api_request("/entities", params=params)
-        datasets = result.get("entities", [])
-        
-        # 응답 변환 - DataHub 특화 형식을 일반적인 형식으로 변환
-        formatted_datasets = []
-        for dataset in datasets:
-            formatted_datasets.append({
-                "name": dataset.get("name", ""),
-                "urn": dataset.get("urn", ""),
-                "platform": self._extract_platform_from_urn(dataset.get("urn", "")),
-                "description": dataset.get("description", "")
-            })
+        datasets = self._iter_api_items("/entities", "entities", params=self._list_datasets_params(limit, offset))
+        formatted_datasets = self._format_datasets(datasets)
         
         self._store_in_cache(cache_key, formatted_datasets)
         return formatted_datasets
@@ -145,12 +342,9 @@ class DatahubConnector(DataCatalogConnector):
         
         endpoint = f"/aspects/{dataset_urn}?aspects=schemaMetadata"
         result = self._make_api_request(endpoint)
+        schema = self._extract_schema(result, dataset_urn)
         
-        schema = result.get("aspects", {}).get("schemaMetadata", {})
-        if not schema:
-            raise ValueError(f"Schema not found for dataset: {dataset_urn}")
-        
-        self._store_in_cache(cache_key, schema)
+        self._store_in_cache(cache_key, schema, dep_keys=(dataset_urn,))
         return schema
     
     def get_dataset_relationships(self, dataset_urn: str) -> List[Dict[str, Any]]:
@@ -161,13 +355,93 @@ class DatahubConnector(DataCatalogConnector):
             return cached_data
         
         endpoint = f"/relationships?urn={dataset_urn}"
-        result = self._make_api_request(endpoint)
+        relationships = list(self._iter_api_items(endpoint, "relationships"))
+        self._store_in_cache(cache_key, relationships, dep_keys=(dataset_urn,))
+        return relationships
+    
+    async def alist_datasets(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """데이터셋 목록 비동기로 가져오기"""
+        cache_key = f"datahub_datasets_{limit}_{offset}"
+        cached_data = self._get_from_cache(cache_key)
+        if cached_data:
+            return cached_data
+        
+        result = await self._amake_api_request("/entities", params=self._list_datasets_params(limit, offset))
+        formatted_datasets = self._format_datasets(result.get("entities", []))
+        
+        self._store_in_cache(cache_key, formatted_datasets)
+        return formatted_datasets
+    
+    async def aget_dataset_schema(self, dataset_urn: str) -> Dict[str, Any]:
+        """특정 데이터셋의 스키마 정보 비동기로 가져오기"""
+        cache_key = f"datahub_schema_{dataset_urn}"
+        cached_data = self._get_from_cache(cache_key)
+        if cached_data:
+            return cached_data
+        
+        endpoint = f"/aspects/{dataset_urn}?aspects=schemaMetadata"
+        result = await self._amake_api_request(endpoint)
+        schema = self._extract_schema(result, dataset_urn)
+        
+        self._store_in_cache(cache_key, schema, dep_keys=(dataset_urn,))
+        return schema
+    
+    async def aget_dataset_relationships(self, dataset_urn: str) -> List[Dict[str, Any]]:
+        """데이터셋의 관계 정보 비동기로 가져오기"""
+        cache_key = f"datahub_relationships_{dataset_urn}"
+        cached_data = self._get_from_cache(cache_key)
+        if cached_data:
+            return cached_data
+        
+        endpoint = f"/relationships?urn={dataset_urn}"
+        result = await self._amake_api_request(endpoint)
         
         relationships = result.get("relationships", [])
-        self._store_in_cache(cache_key, relationships)
+        self._store_in_cache(cache_key, relationships, dep_keys=(dataset_urn,))
         return relationships
     
-    def convert_to_internal_schema(self, datahub_schema: Dict[str, Any]) -> Dict[str, Any]:
+    async def get_all_schemas(self, dataset_urns: List[str]) -> List[Dict[str, Any]]:
+        """여러 데이터셋의 스키마를 동시에 가져오기 (입력 순서대로 반환)"""
+        return await asyncio.gather(*(self.aget_dataset_schema(urn) for urn in dataset_urns))
+    
+    async def get_all_relationships(self, dataset_urns: List[str]) -> List[List[Dict[str, Any]]]:
+        """여러 데이터셋의 관계 정보를 동시에 가져오기 (입력 순서대로 반환)"""
+        return await asyncio.gather(*(self.aget_dataset_relationships(urn) for urn in dataset_urns))
+    
+    @staticmethod
+    def _list_datasets_params(limit: int, offset: int) -> Dict[str, Any]:
+        """데이터셋 목록 조회 파라미터 구성"""
+        return {
+            "limit": limit,
+            "offset": offset,
+            "type": "DATASET"
+        }
+    
+    def _format_datasets(self, datasets: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """응답 변환 - DataHub 특화 형식을 일반적인 형식으로 변환"""
+        extract_platform = self._extract_platform_from_urn
+        formatted_datasets = []
+        append = formatted_datasets.append
+        for dataset in datasets:
+            get = dataset.get
+            urn = get("urn", "")
+            append({
+                "name": get("name", ""),
+                "urn": urn,
+                "platform": extract_platform(urn),
+                "description": get("description", "")
+            })
+        return formatted_datasets
+    
+    @staticmethod
+    def _extract_schema(result: Dict[str, Any], dataset_urn: str) -> Dict[str, Any]:
+        """aspects 응답에서 스키마 메타데이터 추출"""
+        schema = result.get("aspects", {}).get("schemaMetadata", {})
+        if not schema:
+            raise ValueError(f"Schema not found for dataset: {dataset_urn}")
+        return schema
+    
+    def convert_to_internal_schema(self, datahub_schema: Dict[str, Any]) -> InternalSchema:
         """DataHub 스키마를 내부 스키마 형식으로 변환"""
         # 필드 추출
         fields = datahub_schema.get("fields", [])
@@ -178,26 +452,34 @@ class DatahubConnector(DataCatalogConnector):
         if "platformUrn" in datahub_schema:
             platform = self._extract_platform_from_urn(datahub_schema["platformUrn"])
         
+        # 컬럼 변환 (필드별 태그를 한 번 순회하며 비트마스크로 누적)
+        columns: List[InternalColumn] = []
+        append_column = columns.append
+        tag_bits = _TAG_BITS.get
+        for field in fields:
+            mask = 0
+            for tag in field.get("globalTags", {}).get("tags", []):
+                mask |= tag_bits(tag.get("tag", ""), 0)
+                if mask == _ALL_TAG_BITS:
+                    break
+            type_info = field.get("type") or {}
+            append_column({
+                "name": field.get("fieldPath", ""),
+                "type": type_info.get("type", ""),
+                "description": field.get("description", ""),
+                "primary_key": bool(mask & 1),
+                "not_null": bool(mask & 2)
+            })
+        
         # 테이블 생성
-        table = {
+        table: InternalTable = {
             "name": dataset_name,
             "description": datahub_schema.get("description", ""),
-            "columns": [],
+            "columns": columns,
             "indexes": [],
             "relationships": []
         }
         
-        # 컬럼 추가
-        for field in fields:
-            column = {
-                "name": field.get("fieldPath", ""),
-                "type": field.get("type", {}).get("type", ""),
-                "description": field.get("description", ""),
-                "primary_key": any(tag.get("tag", "") == "primaryKey" for tag in field.get("globalTags", {}).get("tags", [])),
-                "not_null": any(tag.get("tag", "") == "nonnull" for tag in field.get("globalTags", {}).get("tags", []))
-            }
-            table["columns"].append(column)
-        
         # 관계 정보 추출 및 인덱스 추정 (DataHub는 직접적인 인덱스 정보를 제공하지 않음)
         # 기본 키를 인덱스로 추가
         primary_keys = [col["name"] for col in table["columns"] if col["primary_key"]]
@@ -210,7 +492,7 @@ class DatahubConnector(DataCatalogConnector):
             })
         
         # 최종 스키마 구성
-        internal_schema = {
+        internal_schema: InternalSchema = {
             "database_name": platform,
             "tables": [table]
         }
@@ -222,17 +504,14 @@ class DatahubConnector(DataCatalogConnector):
         if not urn:
             return "unknown"
         
-        # 예: urn:li:dataset:(urn:li:dataPlatform:mysql,mydb.schema.table,PROD)
-        parts = urn.split(",")
-        if len(parts) > 0:
-            platform_part = parts[0]
-            if "dataPlatform:" in platform_part:
-                return platform_part.split("dataPlatform:")[1]
-        return "unknown"
+        match = _PLATFORM_RE.match(urn)
+        return match.group(1) if match else "unknown"
 
 class CollibraConnector(DataCatalogConnector):
     """Collibra API 연동 클래스"""
     
+    __slots__ = ()
+    
     def list_datasets(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """Collibra API에서 데이터셋 목록 가져오기"""
         # Collibra API 구현
@@ -243,7 +522,7 @@ class CollibraConnector(DataCatalogConnector):
         # Collibra API 구현
         pass
     
-    def convert_to_internal_schema(self, collibra_schema: Dict[str, Any]) -> Dict[str, Any]:
+    def convert_to_internal_schema(self, collibra_schema: Dict[str, Any]) -> InternalSchema:
         """Collibra 스키마를 내부 형식으로 변환"""
         # Collibra 스키마 변환 로직
         pass
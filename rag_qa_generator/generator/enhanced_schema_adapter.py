@@ -1,16 +1,32 @@
 # generator/enhanced_schema_adapter.py
 from typing import Dict, List, Any, Optional
+import heapq
 import logging
 import random
+import textwrap
 
 from generator.schema_utils import SchemaAdapter
-from data_catalog_connectors import DataCatalogConnector
 
 logger = logging.getLogger(__name__)
 
 class EnhancedSchemaAdapter(SchemaAdapter):
     """데이터 카탈로그 메타데이터를 활용하는 스키마 어댑터"""
     
+    # 샘플 SQL 템플릿 (클래스 정의 시 한 번만 구성)
+    _SQL_MEDIUM_FIELD = "SELECT {field}, COUNT(*) as count FROM {table} GROUP BY {field} ORDER BY count DESC LIMIT 10;"
+    _SQL_HARD_FIELD = "SELECT {field}, COUNT(*) as count, AVG(price) as avg_price FROM {table} GROUP BY {field} ORDER BY count DESC LIMIT 10;"
+    _SQL_MEDIUM_JOIN = "SELECT t1.*, t2.* FROM {from_table} t1 JOIN {to_table} t2 ON t1.{from_column} = t2.{to_column} LIMIT 10;"
+    _SQL_HARD_JOIN = textwrap.dedent("""
+        SELECT 
+            t1.*, 
+            t2.*, 
+            (SELECT COUNT(*) FROM {to_table} t3 WHERE t3.{to_column} = t1.{from_column}) as related_count
+        FROM {from_table} t1 
+        LEFT JOIN {to_table} t2 ON t1.{from_column} = t2.{to_column} 
+        GROUP BY t1.{from_column}
+        ORDER BY related_count DESC
+        LIMIT 10;""").strip()
+    
     def __init__(self, schema_loader=None, data_catalog_connector=None):
         """
         Args:
@@ -18,8 +34,23 @@ class EnhancedSchemaAdapter(SchemaAdapter):
             data_catalog_connector: 데이터 카탈로그 커넥터 인스턴스
         """
         super().__init__(schema_loader=schema_loader)
+        self.schema_loader = schema_loader
         self.data_catalog_connector = data_catalog_connector
         self.popularity_cache = {}  # 인기도 정보 캐시
+    
+    def _get_schema(self) -> Dict[str, Any]:
+        """부모 클래스에서 로드한 스키마 재사용 (없으면 스키마 로더에서 한 번만 로드)"""
+        if self.schema is None:
+            return self.reload()
+        return self.schema
+    
+    def reload(self) -> Dict[str, Any]:
+        """스키마 로더에서 스키마를 다시 로드하고 분석 결과 갱신"""
+        self.schema = self.schema_loader.load_schema()
+        self.schema_tables = {}
+        self.table_relationships = []
+        self._analyze_schema()
+        return self.schema
         
     def get_popular_fields(self, dataset_urn: str, limit: int = 10) -> List[Dict[str, Any]]:
         """데이터셋에서 가장 많이 사용되는 필드 정보 가져오기"""
@@ -31,23 +62,29 @@ class EnhancedSchemaAdapter(SchemaAdapter):
             # 일부 데이터 카탈로그는 이러한 기능을 제공하지 않을 수 있음
             
             # 예시 구현 (실제로는 API를 통해 가져와야 함)
-            fields = []
-            schema = self.schema_loader.load_schema()
+            schema = self._get_schema()
+            pairs = [
+                (table, column)
+                for table in schema.get("tables", [])
+                for column in table.get("columns", [])
+            ]
             
-            for table in schema.get("tables", []):
-                for column in table.get("columns", []):
-                    # 임의의 인기도 점수 생성 (실제로는 API에서 가져와야 함)
-                    popularity = random.randint(1, 100)
-                    fields.append({
-                        "table": table.get("name"),
-                        "field": column.get("name"),
-                        "popularity": popularity,
-                        "description": column.get("description", "")
-                    })
+            # 임의의 인기도 점수를 한 번에 생성 (실제로는 API에서 가져와야 함)
+            scores = random.choices(range(1, 101), k=len(pairs))
             
-            # 인기도순 정렬
-            fields.sort(key=lambda x: x["popularity"], reverse=True)
-            return fields[:limit]
+            # 인기도 상위 limit개만 선택 (전체 정렬 없이, 동점은 스키마 순서 유지)
+            top_indexes = heapq.nlargest(limit, range(len(pairs)), key=scores.__getitem__)
+            
+            fields = []
+            for index in top_indexes:
+                table, column = pairs[index]
+                fields.append({
+                    "table": table.get("name"),
+                    "field": column.get("name"),
+                    "popularity": scores[index],
+                    "description": column.get("description", "")
+                })
+            return fields
             
         except Exception as e:
             logger.error(f"Error getting popular fields: {e}")
@@ -61,7 +98,7 @@ class EnhancedSchemaAdapter(SchemaAdapter):
         try:
             # 관계 정보 가져오기 (DataHub API에서 관계 정보 조회)
             relationships = []
-            schema = self.schema_loader.load_schema()
+            schema = self._get_schema()
             
             # 스키마에서 관계 정보 추출
             for table in schema.get("tables", []):
@@ -89,9 +126,11 @@ class EnhancedSchemaAdapter(SchemaAdapter):
         if self.data_catalog_connector and hasattr(self.schema_loader, 'dataset_urn'):
             dataset_urn = self.schema_loader.dataset_urn
             
-            # 인기 필드 기반 질문 추가
+            # 인기 필드와 조인 제안 조회 (둘 다 메모리 안의 스키마 분석이므로 순차 실행)
             popular_fields = self.get_popular_fields(dataset_urn)
+            join_suggestions = self.get_join_suggestions(dataset_urn)
             
+            # 인기 필드 기반 질문 추가
             if popular_fields and difficulty in ['medium', 'hard']:
                 try:
                     # 인기 필드를 활용한 질문 생성
@@ -105,12 +144,12 @@ class EnhancedSchemaAdapter(SchemaAdapter):
                         
                         if difficulty == 'medium':
                             # 중간 난이도 질문 예시
-                            sql = f"SELECT {field_name}, COUNT(*) as count FROM {table_name} GROUP BY {field_name} ORDER BY count DESC LIMIT 10;"
+                            sql = self._SQL_MEDIUM_FIELD.format(field=field_name, table=table_name)
                             question = f"{field['description'] or field_name}별 분포를 확인하세요."
                             answer = f"{table_name} 테이블에서 {field['description'] or field_name}별 빈도를 계산하여 상위 10개를 보여줍니다."
                         else:
                             # 어려운 난이도 질문 예시
-                            sql = f"SELECT {field_name}, COUNT(*) as count, AVG(price) as avg_price FROM {table_name} GROUP BY {field_name} ORDER BY count DESC LIMIT 10;"
+                            sql = self._SQL_HARD_FIELD.format(field=field_name, table=table_name)
                             question = f"{field['description'] or field_name}별 빈도 및 평균 가격을 분석하세요."
                             answer = f"{table_name} 테이블에서 {field['description'] or field_name}별 빈도와 평균 가격을 계산하여 상위 10개를 보여줍니다."
                         
@@ -122,8 +161,6 @@ class EnhancedSchemaAdapter(SchemaAdapter):
                     logger.error(f"Error enhancing samples with popular fields: {e}")
             
             # 조인 제안 기반 질문 추가
-            join_suggestions = self.get_join_suggestions(dataset_urn)
-            
             if join_suggestions and difficulty in ['medium', 'hard']:
                 try:
                     # 조인 제안을 활용한 질문 생성
@@ -140,26 +177,17 @@ class EnhancedSchemaAdapter(SchemaAdapter):
                         
                         if difficulty == 'medium':
                             # 중간 난이도 조인 질문
-                            sql = f"SELECT t1.*, t2.* FROM {from_table} t1 JOIN {to_table} t2 ON t1.{from_column} = t2.{to_column} LIMIT 10;"
+                            sql = self._SQL_MEDIUM_JOIN.format(**join)
                             question = f"{from_table}과 {to_table}의 관계를 조회하세요."
                             answer = f"{from_table}과 {to_table}을 {from_column}과 {to_column} 컬럼을 기준으로 조인하여 관련 정보를 조회합니다."
                         else:
                             # 어려운 난이도 조인 질문
-                            sql = f"""
-                            SELECT 
-                                t1.*, 
-                                t2.*, 
-                                (SELECT COUNT(*) FROM {to_table} t3 WHERE t3.{to_column} = t1.{from_column}) as related_count
-                            FROM {from_table} t1 
-                            LEFT JOIN {to_table} t2 ON t1.{from_column} = t2.{to_column} 
-                            GROUP BY t1.{from_column}
-                            ORDER BY related_count DESC
-                            LIMIT 10;"""
+                            sql = self._SQL_HARD_JOIN.format(**join)
                             question = f"각 {from_table}에 연결된 {to_table}의 수를 계산하세요."
                             answer = f"각 {from_table}에 연결된 {to_table}의 수를 계산하고, 연결된 항목이 많은 순으로 정렬하여 상위 10개를 보여줍니다."
                         
                         samples[idx]["question"] = question
-                        samples[idx]["sql"] = sql.strip()
+                        samples[idx]["sql"] = sql
                         samples[idx]["answer"] = answer
                 
                 except Exception as e:
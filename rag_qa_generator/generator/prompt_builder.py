@@ -1,10 +1,150 @@
 import re
-from typing import Dict, List, Optional, Any, Union
-import json
+from typing import Dict, List, Optional, Any, Tuple, Union
+
+# 문자열 스키마에서 테이블명 추출용 정규식
+_TABLE_RE = re.compile(r'CREATE\s+TABLE\s+(?:\w+\.)?(\w+)', re.IGNORECASE)
+
+# 사용자 프롬프트의 JSON 출력 요청 여부 (프롬프트 전체를 소문자로 복사하지 않고 검색)
+_JSON_RE = re.compile(r'json', re.IGNORECASE)
+
+# 난이도별 설명 (더 간결하게 제공)
+_DIFFICULTY_DESCRIPTIONS = {
+    "easy": "단일 테이블 쿼리와 기본 조건만 사용",
+    "medium": "2개 테이블 JOIN과 GROUP BY 사용",
+    "hard": "다중 테이블 JOIN, 서브쿼리, 윈도우 함수 사용"
+}
+
+# Q&A 생성 프롬프트에서 생성 수에 따라 달라지는 마지막 지시문
+_OLLAMA_QA_TAIL = "정확히 {count}개의 항목을 생성하고, JSON 형식만 반환하세요. 다른 설명이나 텍스트는 추가하지 마세요."
+_DEFAULT_QA_TAIL = "정확히 {count}개의 Q&A를 생성하세요. 유효한 JSON만 반환하세요."
+
+# SQL 유효성 검증 사용자 프롬프트 템플릿 (변하지 않는 스키마 블록을 앞에, 질문/SQL을 뒤에 배치)
+_SQL_VALIDATION_TMPL = """{schema_block}다음 질문과 SQL 쿼리를 검증하세요:
+## 질문
+{question}
+## SQL 쿼리
+```sql
+{sql}
+```
+이 SQL 쿼리가 다음 기준에 맞는지 검증하세요:
+1. 문법적으로 올바른가?
+2. 모든 테이블과 컬럼이 스키마에 존재하는가?
+3. 질문에 대한 답을 제공하는가?
+검증 결과를 다음 JSON 형식으로 반환하세요:
+```json
+{{
+  "is_valid": true 또는 false,
+  "errors": ["오류 메시지 1", "오류 메시지 2", ...],
+  "corrected_sql": "수정된 SQL 쿼리 (필요한 경우)"
+}}
+```"""
+
+# 답변 생성 사용자 프롬프트 템플릿
+_ANSWER_TMPL = """{schema_block}다음 질문과 SQL 쿼리를 바탕으로 답변을 작성하세요:
+## 질문
+{question}
+## SQL 쿼리
+```sql
+{sql}
+```
+위 스키마를 참고하여 SQL 쿼리를 분석하고, 어떤 결과를 반환할지 설명하는 자연스러운 답변을 작성하세요."""
+
+# 여러 질문의 답변을 한 번에 생성하는 사용자 프롬프트 템플릿
+_BATCH_ANSWER_TMPL = """{schema_block}다음 질문과 SQL 쿼리 목록의 각 항목에 대해 답변을 작성하세요:
+{items_text}
+위 스키마를 참고하여 각 SQL 쿼리를 분석하고, 어떤 결과를 반환할지 설명하는 자연스러운 답변을 작성하세요.
+답변은 다음 JSON 형식으로만 반환하세요. 다른 설명이나 텍스트는 추가하지 마세요:
+```json
+[
+  {{"index": 1, "answer": "1번 항목의 답변"}},
+  {{"index": 2, "answer": "2번 항목의 답변"}}
+]
+```
+정확히 {count}개의 답변을 항목 번호와 함께 반환하세요."""
+
+# 모델 타입별 출력 포맷팅 메서드 이름 (Ollama는 모델 이름에 포함 여부로 별도 판단)
+_FORMATTER_NAMES = {
+    "openai": "_format_chat",
+    "claude": "_format_chat",
+    "huggingface": "_format_huggingface"
+}
+
+# 답변 생성 시스템 프롬프트
+_ANSWER_SYSTEM_PROMPT = "당신은 SQL 전문가이며 데이터 분석가입니다. SQL 쿼리의 결과를 명확하고 이해하기 쉬운 자연어로 설명해야 합니다."
+
+# Q&A 생성 프롬프트 접두사 템플릿은 스키마 -> 예시 -> 난이도 -> 출력 형식 순으로 배치
+# (난이도와 무관한 스키마 블록을 맨 앞에 두어 모델 제공자의 프롬프트 캐시 적중률을 높임)
+
+# Ollama 모델용 Q&A 생성 프롬프트 접두사 템플릿 (스키마 정보 강조 버전)
+_OLLAMA_QA_TMPL = """## 데이터베이스 스키마
+    {schema_summary}{tables_instruction}
+
+    ## 중요: 위의 스키마에 있는 테이블과 컬럼만 사용하세요. 가상의 테이블이나 컬럼을 사용하지 마세요.
+
+    위의 데이터베이스 스키마를 바탕으로 {difficulty} 난이도의 SQL 질문을 생성하세요.
+
+    난이도: {difficulty_upper} ({difficulty_desc})
+
+    각 질문에 대해 다음 정보를 포함하는 JSON 형식으로 응답하세요:
+    1. 질문 (question): 데이터베이스에 관한 질문
+    2. SQL 쿼리 (sql): 질문에 답하는 유효한 SQL 쿼리
+    3. 답변 (answer): SQL 쿼리가 반환할 결과에 대한 설명
+
+    JSON 응답 형식:
+    ```json
+    [
+    {{
+        "difficulty": "{difficulty}",
+        "question": "질문 내용",
+        "sql": "SQL 쿼리",
+        "answer": "답변 내용"
+    }}
+    ]
+    ```"""
+
+# 기타 모델용 Q&A 생성 프롬프트 접두사 템플릿 - 명확한 지시 및 출력 형식 강조
+_DEFAULT_QA_TMPL = """## 데이터베이스 스키마
+    {schema_summary}{tables_instruction}
+
+    ## 중요: 위의 스키마에 있는 테이블과 컬럼만 사용하세요. 가상의 테이블이나 컬럼을 사용하지 마세요.
+
+    {examples_text}
+
+    위의 데이터베이스 스키마를 바탕으로 {difficulty} 난이도의 SQL Q&A를 생성하세요.
+
+    ## 난이도: {difficulty_upper}
+    {difficulty_desc}
+
+    ## 지침
+    1. 각 Q&A는 질문, SQL 쿼리, 답변으로 구성합니다.
+    2. 질문은 명확하고 구체적이어야 합니다.
+    3. SQL 쿼리는 정확하고 실행 가능해야 합니다.
+    4. 답변은 SQL 쿼리의 예상 결과를 자연어로 설명해야 합니다.
+    5. 답변에 SQL 쿼리를 포함하지 마세요.
+
+    ## 중요: 출력 형식
+    아래 JSON 형식으로만 응답하세요. 다른 설명이나 텍스트를 추가하지 마세요:
+
+    ```json
+    [
+    {{
+        "difficulty": "{difficulty}",
+        "question": "질문 내용",
+        "sql": "SQL 쿼리",
+        "answer": "답변 내용"
+    }}
+    ]
+    ```"""
 
 class PromptBuilder:
     """LLM 프롬프트 생성 유틸리티 클래스"""
     
+    __slots__ = (
+        "model_type", "schema", "examples",
+        "_schema_tables", "_schema_summary", "_schema_block",
+        "_qa_prefixes", "_qa_tail", "_formatter", "_qa_model_inputs"
+    )
+    
     def __init__(
         self, 
         model_type: str,
@@ -20,6 +160,26 @@ class PromptBuilder:
         self.model_type = model_type.lower()
         self.schema = schema_formatted
         self.examples = examples or []
+        
+        # 스키마에서 추출한 테이블 목록/요약 (스키마에만 의존하므로 한 번만 계산)
+        self._schema_tables, self._schema_summary = self._extract_schema_info(schema_formatted)
+        
+        # 검증/답변 프롬프트 앞부분에 공통으로 들어가는 스키마 블록
+        self._schema_block = f"## 데이터베이스 스키마\n{self.schema}\n"
+        
+        # Q&A 사용자 프롬프트 중 생성 수와 무관한 앞부분: 난이도 -> 프롬프트 접두사
+        # (접두사를 바이트 단위로 동일하게 유지해 모델 제공자의 프롬프트 캐시가 적중하도록 함)
+        self._qa_tail = _OLLAMA_QA_TAIL if "ollama" in self.model_type else _DEFAULT_QA_TAIL
+        self._qa_prefixes: Dict[str, str] = {
+            difficulty: self._render_qa_prefix(difficulty)
+            for difficulty in _DIFFICULTY_DESCRIPTIONS
+        }
+        
+        # 모델 타입별 출력 포맷터 (model_type은 이미 소문자로 정규화됨)
+        self._formatter = self._resolve_formatter()
+        
+        # (난이도, 생성 수)별 모델 입력 캐시 (스키마/예제가 고정이므로 무효화 불필요)
+        self._qa_model_inputs: Dict[Tuple[str, int], Dict[str, Any]] = {}
     
     def build_qa_generation_prompt(
         self, 
@@ -32,33 +192,27 @@ class PromptBuilder:
             "user_prompt": self._build_qa_user_prompt(difficulty, count)
         }
     
+    def build_qa_model_inputs(self, difficulty: str, count: int = 1) -> Dict[str, Any]:
+        """Q&A 생성 프롬프트를 모델 입력 형식으로 변환한 결과 (같은 요청은 재사용)
+        
+        반환된 딕셔너리는 공유되므로 수정하지 마세요.
+        """
+        key = (difficulty, count)
+        model_inputs = self._qa_model_inputs.get(key)
+        if model_inputs is None:
+            model_inputs = self.format_output_for_model(self.build_qa_generation_prompt(difficulty, count))
+            self._qa_model_inputs[key] = model_inputs
+        return model_inputs
+    
     def build_sql_validation_prompt(
         self, 
         question: str, 
         sql: str
     ) -> Dict[str, str]:
         """SQL 유효성 검증을 위한 프롬프트 구성"""
-        user_prompt = f"""다음 질문과 SQL 쿼리를 검증하세요:
-## 질문
-{question}
-## SQL 쿼리
-```sql
-{sql}
-```
-## 데이터베이스 스키마
-{self.schema}
-이 SQL 쿼리가 다음 기준에 맞는지 검증하세요:
-1. 문법적으로 올바른가?
-2. 모든 테이블과 컬럼이 스키마에 존재하는가?
-3. 질문에 대한 답을 제공하는가?
-검증 결과를 다음 JSON 형식으로 반환하세요:
-```json
-{{
-  "is_valid": true 또는 false,
-  "errors": ["오류 메시지 1", "오류 메시지 2", ...],
-  "corrected_sql": "수정된 SQL 쿼리 (필요한 경우)"
-}}
-```"""
+        user_prompt = _SQL_VALIDATION_TMPL.format_map({
+            "schema_block": self._schema_block, "question": question, "sql": sql
+        })
         return {
             "system_prompt": self._get_sql_validation_system_prompt(),
             "user_prompt": user_prompt
@@ -70,18 +224,35 @@ class PromptBuilder:
         sql: str
     ) -> Dict[str, str]:
         """질문에 대한 답변 생성을 위한 프롬프트 구성"""
-        user_prompt = f"""다음 질문과 SQL 쿼리를 바탕으로 답변을 작성하세요:
-## 질문
-{question}
-## SQL 쿼리
-```sql
-{sql}
-```
-## 데이터베이스 스키마
-{self.schema}
-SQL 쿼리를 분석하고, 어떤 결과를 반환할지 설명하는 자연스러운 답변을 작성하세요."""
+        user_prompt = _ANSWER_TMPL.format_map({
+            "schema_block": self._schema_block, "question": question, "sql": sql
+        })
+        return {
+            "system_prompt": _ANSWER_SYSTEM_PROMPT,
+            "user_prompt": user_prompt
+        }
+    
+    def build_batch_answer_generation_prompt(
+        self, 
+        items: List[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """여러 질문에 대한 답변을 한 번에 생성하기 위한 프롬프트 구성
+        
+        Args:
+            items: 'question'과 'sql' 키를 가진 항목 리스트 (응답의 index는 1부터 시작)
+            
+        Returns:
+            시스템/사용자 프롬프트 딕셔너리
+        """
+        items_text = "".join(
+            f"### 항목 {index}\n질문: {item.get('question', '')}\nSQL: ```sql\n{item.get('sql', '')}\n```\n"
+            for index, item in enumerate(items, 1)
+        )
+        user_prompt = _BATCH_ANSWER_TMPL.format_map({
+            "schema_block": self._schema_block, "items_text": items_text, "count": len(items)
+        })
         return {
-            "system_prompt": "당신은 SQL 전문가이며 데이터 분석가입니다. SQL 쿼리의 결과를 명확하고 이해하기 쉬운 자연어로 설명해야 합니다.",
+            "system_prompt": _ANSWER_SYSTEM_PROMPT,
             "user_prompt": user_prompt
         }
     
@@ -106,15 +277,34 @@ SQL 쿼리를 분석하고, 어떤 결과를 반환할지 설명하는 자연스
         Returns:
             사용자 프롬프트 문자열
         """
+        # 난이도별 접두사는 생성 시 미리 만들어 두고, 생성 수가 들어가는 끝부분만 매번 결합
+        prefix = self._qa_prefixes.get(difficulty)
+        if prefix is None:
+            prefix = self._render_qa_prefix(difficulty)
+            self._qa_prefixes[difficulty] = prefix
+        
+        return f"{prefix}\n\n    생성 개수: {count}\n    {self._qa_tail.format(count=count)}"
+    
+    @staticmethod
+    def _extract_schema_info(schema: Any) -> Tuple[List[str], Any]:
+        """스키마에서 테이블 목록과 프롬프트용 스키마 요약 추출
+        
+        Args:
+            schema: 형식화된 스키마 텍스트 또는 스키마 딕셔너리
+            
+        Returns:
+            (테이블 이름 목록, 스키마 요약) 튜플
+        """
         # 테이블 목록 추출 (스키마 정보가 있는 경우)
         schema_tables = []
         schema_summary = ""
         
         # 스키마에서 정보 추출 시도
         try:
-            schema_str = self.schema
+            schema_str = schema
             if not isinstance(schema_str, str) and hasattr(schema_str, 'get'):
-                # 사전 형태의 스키마
+                # 사전 형태의 스키마 (요약 줄은 목록에 모았다가 한 번에 결합)
+                summary_lines = []
                 tables = schema_str.get('tables', [])
                 for table in tables:
                     table_name = table.get('name', '')
@@ -126,33 +316,40 @@ SQL 쿼리를 분석하고, 어떤 결과를 반환할지 설명하는 자연스
                         col_names = [col.get('name', '') for col in columns if col.get('name', '')]
                         
                         if col_names:
-                            schema_summary += f"테이블 {table_name}: {', '.join(col_names)}\n"
+                            summary_lines.append(f"테이블 {table_name}: {', '.join(col_names)}\n")
+                schema_summary = "".join(summary_lines)
             else:
                 # 문자열 형태의 스키마에서 테이블명 추출 시도
-                table_pattern = r'CREATE\s+TABLE\s+(?:\w+\.)?(\w+)'
-                schema_tables = re.findall(table_pattern, schema_str, re.IGNORECASE)
+                schema_tables = _TABLE_RE.findall(schema_str)
                 
                 # 스키마 요약은 원본 스키마 그대로 사용
                 schema_summary = schema_str
         except Exception:
             # 추출 실패 시 빈 목록 사용
             schema_tables = []
-            schema_summary = self.schema  # 원본 스키마 유지
+            schema_summary = schema  # 원본 스키마 유지
         
-        # 난이도별 설명 (더 간결하게 제공)
-        difficulty_descriptions = {
-            "easy": "단일 테이블 쿼리와 기본 조건만 사용",
-            "medium": "2개 테이블 JOIN과 GROUP BY 사용",
-            "hard": "다중 테이블 JOIN, 서브쿼리, 윈도우 함수 사용"
-        }
+        return schema_tables, schema_summary
+    
+    def _render_qa_prefix(self, difficulty: str) -> str:
+        """Q&A 생성용 사용자 프롬프트 중 생성 수와 무관한 앞부분 생성
+        
+        Args:
+            difficulty: 난이도 ('easy', 'medium', 'hard')
+            
+        Returns:
+            생성 수 지시문을 제외한 프롬프트 접두사
+        """
+        schema_tables = self._schema_tables
+        schema_summary = self._schema_summary
         
         # 난이도에 맞는 설명 선택
-        difficulty_desc = difficulty_descriptions.get(
-            difficulty.lower(), difficulty_descriptions["medium"]
+        difficulty_desc = _DIFFICULTY_DESCRIPTIONS.get(
+            difficulty.lower(), _DIFFICULTY_DESCRIPTIONS["medium"]
         )
         
         # Ollama 모델용 최적화
-        if "ollama" in self.model_type.lower():
+        if "ollama" in self.model_type:
             # 스키마 정보 강조 버전
             tables_str = ", ".join(schema_tables) if schema_tables else "제공된 스키마의 테이블"
             
@@ -161,35 +358,13 @@ SQL 쿼리를 분석하고, 어떤 결과를 반환할지 설명하는 자연스
             if schema_tables:
                 tables_instruction = f"\n\n사용 가능한 테이블: {tables_str}\n다음 테이블들만 사용하여 SQL을 작성하세요."
             
-            prompt = f"""다음 데이터베이스 스키마를 바탕으로 {difficulty} 난이도의 SQL 질문을 {count}개 생성하세요.
-
-    ## 데이터베이스 스키마
-    {schema_summary}{tables_instruction}
-
-    ## 중요: 위의 스키마에 있는 테이블과 컬럼만 사용하세요. 가상의 테이블이나 컬럼을 사용하지 마세요.
-
-    난이도: {difficulty.upper()} ({difficulty_desc})
-
-    각 질문에 대해 다음 정보를 포함하는 JSON 형식으로 응답하세요:
-    1. 질문 (question): 데이터베이스에 관한 질문
-    2. SQL 쿼리 (sql): 질문에 답하는 유효한 SQL 쿼리
-    3. 답변 (answer): SQL 쿼리가 반환할 결과에 대한 설명
-
-    JSON 응답 형식:
-    ```json
-    [
-    {{
-        "difficulty": "{difficulty}",
-        "question": "질문 내용",
-        "sql": "SQL 쿼리",
-        "answer": "답변 내용"
-    }}
-    ]
-    ```
-
-    정확히 {count}개의 항목을 생성하고, JSON 형식만 반환하세요. 다른 설명이나 텍스트는 추가하지 마세요."""
-
-            return prompt
+            return _OLLAMA_QA_TMPL.format_map({
+                "difficulty": difficulty,
+                "difficulty_upper": difficulty.upper(),
+                "difficulty_desc": difficulty_desc,
+                "schema_summary": schema_summary,
+                "tables_instruction": tables_instruction
+            })
         
         # 다른 모델용 기존 프롬프트 (스키마 정보 강조)
         # 예시 추가 (있는 경우)
@@ -210,61 +385,42 @@ SQL 쿼리를 분석하고, 어떤 결과를 반환할지 설명하는 자연스
             tables_instruction = f"\n\n사용 가능한 테이블: {tables_str}\n위의 테이블들만 사용하여 SQL을 작성하세요."
         
         # 프롬프트 구성 - 명확한 지시 및 출력 형식 강조
-        prompt = f"""다음 데이터베이스 스키마를 바탕으로 {difficulty} 난이도의 SQL Q&A를 {count}개 생성하세요.
-
-    ## 데이터베이스 스키마
-    {schema_summary}{tables_instruction}
-
-    ## 중요: 위의 스키마에 있는 테이블과 컬럼만 사용하세요. 가상의 테이블이나 컬럼을 사용하지 마세요.
-
-    ## 난이도: {difficulty.upper()}
-    {difficulty_desc}
-
-    {examples_text}
-
-    ## 지침
-    1. 각 Q&A는 질문, SQL 쿼리, 답변으로 구성합니다.
-    2. 질문은 명확하고 구체적이어야 합니다.
-    3. SQL 쿼리는 정확하고 실행 가능해야 합니다.
-    4. 답변은 SQL 쿼리의 예상 결과를 자연어로 설명해야 합니다.
-    5. 답변에 SQL 쿼리를 포함하지 마세요.
-
-    ## 중요: 출력 형식
-    아래 JSON 형식으로만 응답하세요. 다른 설명이나 텍스트를 추가하지 마세요:
-
-    ```json
-    [
-    {{
-        "difficulty": "{difficulty}",
-        "question": "질문 내용",
-        "sql": "SQL 쿼리",
-        "answer": "답변 내용"
-    }}
-    ]
-    ```
-
-    정확히 {count}개의 Q&A를 생성하세요. 유효한 JSON만 반환하세요."""
-        
-        return prompt
+        return _DEFAULT_QA_TMPL.format_map({
+            "difficulty": difficulty,
+            "difficulty_upper": difficulty.upper(),
+            "difficulty_desc": difficulty_desc,
+            "schema_summary": schema_summary,
+            "tables_instruction": tables_instruction,
+            "examples_text": examples_text
+        })
+    
     def format_output_for_model(self, prompt_dict: Dict[str, str]) -> Dict[str, Any]:
         """모델 타입에 따라 프롬프트 포맷팅"""
-        system_prompt = prompt_dict.get("system_prompt", "")
-        user_prompt = prompt_dict.get("user_prompt", "")
+        # 모델별 포맷팅 (포맷터는 생성 시 모델 타입으로 한 번만 결정)
+        get = prompt_dict.get
+        return self._formatter(get("system_prompt", ""), get("user_prompt", ""))
+    
+    def _resolve_formatter(self):
+        """모델 타입에 맞는 포맷팅 메서드 선택"""
+        if "ollama" in self.model_type:
+            return self._format_ollama
         
-        # 모델별 포맷팅
-        if "ollama" in self.model_type.lower():
-            # Ollama 모델 최적화: llama2 모델은 특히 JSON 생성에 어려움을 겪음
-            if "llama" in self.model_type.lower() and "json" in user_prompt.lower():
-                # JSON 형식을 강조하는 시스템 프롬프트
-                json_system = """당신은 항상 유효한 JSON 형식으로만 응답하는 SQL 및 데이터베이스 전문가입니다.
+        return getattr(self, _FORMATTER_NAMES.get(self.model_type, "_format_default"))
+    
+    def _format_ollama(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """Ollama 모델용 포맷팅"""
+        # Ollama 모델 최적화: llama2 모델은 특히 JSON 생성에 어려움을 겪음
+        if "llama" in self.model_type and _JSON_RE.search(user_prompt):
+            # JSON 형식을 강조하는 시스템 프롬프트
+            json_system = """당신은 항상 유효한 JSON 형식으로만 응답하는 SQL 및 데이터베이스 전문가입니다.
     다른 설명이나 텍스트는 절대 추가하지 마세요. 
     오직 요청된 JSON 형식으로만 응답하세요."""
-                
-                # 시스템 프롬프트와 사용자 프롬프트 결합
-                combined_prompt = f"{json_system}\n\n{user_prompt}"
-                
-                # JSON 형식을 강조하는 접두사 추가
-                combined_prompt = """중요: 다음 형식의 유효한 JSON만 출력하세요:
+            
+            # 시스템 프롬프트와 사용자 프롬프트 결합
+            combined_prompt = f"{json_system}\n\n{user_prompt}"
+            
+            # JSON 형식을 강조하는 접두사 추가
+            combined_prompt = """중요: 다음 형식의 유효한 JSON만 출력하세요:
     ```json
     [
     {
@@ -278,24 +434,25 @@ SQL 쿼리를 분석하고, 어떤 결과를 반환할지 설명하는 자연스
     다른 텍스트나 설명을 추가하지 마세요. 오직 위 형식의 JSON만 반환하세요.
 
     """ + combined_prompt
-                
-                return {"prompt": combined_prompt}
-            else:
-                # 일반 Ollama 요청
-                combined_prompt = f"시스템: {system_prompt}\n\n사용자 요청:\n{user_prompt}"
-                return {"prompt": combined_prompt}
-        elif self.model_type.lower() == "openai":
-            return {
-                "system_prompt": system_prompt,
-                "prompt": user_prompt
-            }
-        elif self.model_type.lower() == "claude":
-            return {
-                "system_prompt": system_prompt, 
-                "prompt": user_prompt
-            }
-        elif self.model_type.lower() == "huggingface":
-            return {"prompt": f"시스템: {system_prompt}\n\n사용자: {user_prompt}"}
-        else:
-            combined_prompt = f"{system_prompt}\n\n{user_prompt}"
+            
             return {"prompt": combined_prompt}
+        
+        # 일반 Ollama 요청
+        combined_prompt = f"시스템: {system_prompt}\n\n사용자 요청:\n{user_prompt}"
+        return {"prompt": combined_prompt}
+    
+    def _format_chat(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """시스템 프롬프트를 별도로 받는 모델(OpenAI, Claude)용 포맷팅"""
+        return {
+            "system_prompt": system_prompt,
+            "prompt": user_prompt
+        }
+    
+    def _format_huggingface(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """HuggingFace 모델용 포맷팅"""
+        return {"prompt": f"시스템: {system_prompt}\n\n사용자: {user_prompt}"}
+    
+    def _format_default(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """기타 모델용 포맷팅"""
+        combined_prompt = f"{system_prompt}\n\n{user_prompt}"
+        return {"prompt": combined_prompt}
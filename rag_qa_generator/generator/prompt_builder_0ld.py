@@ -1,6 +1,4 @@
-import re
 from typing import Dict, List, Optional, Any
-import json
 
 class PromptBuilder:
     """LLM 프롬프트 생성 유틸리티 클래스"""
@@ -1,25 +1,218 @@
-import json
+import asyncio
+import hashlib
+import itertools
+import logging
+import threading
 import time
 import re
-import concurrent.futures
-from typing import Dict, List, Any, Optional, Union, Tuple
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterable, List, Any, NamedTuple, Optional, Sized, Union, Tuple
 from pathlib import Path
-import random
-import logging
-from functools import partial
 
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from models.base_model import BaseModel
+import json_utils
+from models.base_model import BaseModel, backoff_delay
 from data.schema_loader import SchemaLoader
 from data.qa_loader import QALoader
 from generator.prompt_builder import PromptBuilder
 from generator.sql_validator import SQLValidator
 from utils.logger import get_logger 
+from utils.rate_limiter import RateLimiter
 # schema_utils.py가 generator/ 폴더 내에 있는 경우
 from .schema_utils import SchemaAdapter  # 상대 경로 임포트
-  
+
+# 검증 시 Q&A 항목에 반드시 있어야 하는 필드 (답변은 generate_answers로 채울 수 있으므로 제외)
+_REQUIRED_QA_KEYS = frozenset(("question", "sql"))
+
+# 문자열 스키마의 CREATE TABLE 문에서 테이블명 추출
+_CREATE_TABLE_RE = re.compile(r'CREATE\s+TABLE\s+(?:\w+\.)?(\w+)', re.IGNORECASE)
+
+# 문자열 스키마의 CREATE TABLE 정의부(테이블명, 첫 닫는 괄호까지의 본문)와 본문 속 컬럼명
+_TABLE_DEF_RE = re.compile(r'CREATE\s+TABLE\s+(?:\w+\.)?(\w+)\s*\((.*?)\)', re.IGNORECASE | re.DOTALL)
+_COLUMN_NAME_RE = re.compile(r'[\s,](\w+)[\s\n]+')
+
+# 항목 검증 시 SQL마다 사용하는 정규식 (모듈 로드 시 한 번만 컴파일)
+# FROM/JOIN 뒤의 테이블명과 SELECT/FROM 키워드를 한 번의 스캔으로 추출
+_SQL_FACT_RE = re.compile(r'(?:FROM|JOIN)\s+([a-zA-Z0-9_]+)|(SELECT)|FROM', re.IGNORECASE)
+# SELECT/FROM 키워드 포함 여부 (위 스캔에서 키워드가 테이블명 안에만 있어 놓친 경우 확인)
+_SELECT_WORD_RE = re.compile(r'SELECT', re.IGNORECASE)
+_FROM_WORD_RE = re.compile(r'FROM', re.IGNORECASE)
+
+# 텍스트 응답에서 질문/SQL/답변을 추출하는 정규식 (JSON 파싱 실패 시 사용)
+_TEXT_QUESTION_RE = re.compile(r'(?:질문|question):?\s*(.*?)(?=(?:SQL|sql|쿼리|query):|<br>|\n\n|$)', re.DOTALL)
+_TEXT_SQL_RE = re.compile(r'(?:SQL|sql|쿼리|query):?\s*(?:```sql)?\s*(.*?)(?:```|\n\n(?:답변|answer):|<br>|$)', re.DOTALL)
+_TEXT_ANSWER_RE = re.compile(r'(?:답변|answer|결과):?\s*(.*?)(?=\n\n(?:질문|question):|<br>|\n\n|$)', re.DOTALL)
+
+# 위 패턴들이 시작하는 레이블 (부분 문자열 검사로 일치 가능성이 없는 텍스트를 빠르게 제외)
+_QUESTION_LABELS = ("질문", "question")
+_SQL_LABELS = ("SQL", "sql", "쿼리", "query")
+_ANSWER_LABELS = ("답변", "answer", "결과")
+
+_SELECT_KEYWORD_RE = re.compile(r'SELECT\s+', re.IGNORECASE)
+_FROM_KEYWORD_RE = re.compile(r'FROM\s+', re.IGNORECASE)
+_TEXT_SQL_BLOCK_RE = re.compile(r'```sql\s*(.*?)\s*```', re.DOTALL)
+
+# 응답에서 JSON 배열/객체 부분을 찾는 정규식 (괄호 짝 분석이 실패한 경우에만 사용)
+_JSON_ARRAY_START_RE = re.compile(r'\[\s*\{')
+_JSON_OBJECT_START_RE = re.compile(r'\{\s*"')
+
+# 병렬 생성 시 한 번의 요청으로 생성할 최대 Q&A 항목 수 (응답이 잘리지 않는 범위)
+_MAX_ITEMS_PER_REQUEST = 20
+
+# 모델 응답 메모리 캐시 최대 항목 수
+_RESPONSE_CACHE_MAXSIZE = 1024
+
+# 예제 구성별로 재사용하는 프롬프트 빌더 최대 개수
+_PROMPT_BUILDER_CACHE_MAXSIZE = 32
+
+def _example_sort_key(example: Dict[str, Any]) -> bytes:
+    """예제 정렬 키 (질문 텍스트의 안정적인 해시)"""
+    question = str(example.get("question", ""))
+    return hashlib.blake2b(question.encode("utf-8"), digest_size=8).digest()
+
+
+def _contains_any(text: str, needles: Tuple[str, ...]) -> bool:
+    """text에 needles 중 하나라도 포함되어 있는지 확인"""
+    return any(needle in text for needle in needles)
+
+
+def _strip_sql_fences(sql: str) -> str:
+    """SQL에서 코드 블록 표시(```sql, ```)를 제거하고 앞뒤 공백 정리
+    
+    re.sub(r'```sql|```', '', sql)와 같은 결과를 정규식 없이 만듭니다. 표시가 없는
+    대부분의 SQL은 포함 여부만 확인하고 바로 반환합니다.
+    """
+    if '```' not in sql:
+        return sql.strip()
+    
+    # 왼쪽부터 겹치지 않게 찾은 ``` 뒤에 sql이 이어지면 함께 제거
+    first, *rest = sql.split('```')
+    return (first + ''.join(part[3:] if part.startswith('sql') else part for part in rest)).strip()
+
+
+class _SqlFacts(NamedTuple):
+    """항목 검증에 필요한 SQL 정보 (SQL을 한 번 스캔해 수집)"""
+    clean: str                   # 코드 블록 표시를 제거한 SQL
+    used_tables: Tuple[str, ...] # FROM/JOIN 뒤의 테이블명 (중복 제거, 등장 순서 유지)
+    has_keywords: bool           # SELECT와 FROM 키워드를 모두 포함하는지 여부
+
+
+def _extract_sql_facts(sql: str) -> _SqlFacts:
+    """SQL 정리와 키워드/사용 테이블 추출을 한 번에 수행"""
+    clean = _strip_sql_fences(sql)
+    
+    used_tables = {}
+    has_select = has_from = False
+    for match in _SQL_FACT_RE.finditer(clean):
+        table = match.group(1)
+        if table is not None:
+            used_tables[table] = None
+            # JOIN 뒤의 테이블도 여기서 처리되므로 FROM 여부는 일치 문자열로 확인
+            if not has_from:
+                has_from = match.group(0)[:4].upper() == "FROM"
+        elif match.group(2) is not None:
+            has_select = True
+        else:
+            has_from = True
+    
+    # 키워드가 테이블명 안에만 있는 경우(예: FROM selections)는 부분 문자열로 다시 확인
+    if not has_select:
+        has_select = _SELECT_WORD_RE.search(clean) is not None
+    if not has_from:
+        has_from = _FROM_WORD_RE.search(clean) is not None
+    
+    return _SqlFacts(clean, tuple(used_tables), has_select and has_from)
+
+
+def _find_select_statements(text: str) -> List[str]:
+    """텍스트에서 'SELECT ... FROM ...' 문장을 ; 또는 텍스트 끝까지 추출
+    
+    정규식 r'(SELECT\\s+.*?FROM\\s+.*?(?:;|$))'와 같은 결과를 반환하지만, FROM이 없는
+    SELECT마다 텍스트 끝까지 다시 탐색하지 않으므로 긴 응답에서도 선형 시간에 동작합니다.
+    """
+    statements = []
+    # $는 텍스트 끝 또는 마지막 줄바꿈 바로 앞에서 일치
+    text_end = len(text) - 1 if text.endswith("\n") else len(text)
+    pos = 0
+    
+    while True:
+        select_match = _SELECT_KEYWORD_RE.search(text, pos)
+        if not select_match:
+            break
+        
+        # 이후에 FROM이 없으면 뒤따르는 SELECT도 일치할 수 없음
+        from_match = _FROM_KEYWORD_RE.search(text, select_match.end())
+        if not from_match:
+            break
+        
+        semicolon = text.find(";", from_match.end())
+        if from_match.end() > text_end:
+            end = from_match.end()
+        elif semicolon != -1 and semicolon < text_end:
+            end = semicolon + 1
+        else:
+            end = text_end
+        
+        statements.append(text[select_match.start():end])
+        pos = end
+    
+    return statements
+
+
+def _run_coroutine(coro: Any) -> Any:
+    """동기 API에서 코루틴을 실행하고 결과 반환
+    
+    호출한 스레드에 이미 실행 중인 이벤트 루프가 있으면(Jupyter, 비동기 웹 핸들러 등)
+    asyncio.run()을 쓸 수 없으므로 별도 스레드의 새 이벤트 루프에서 실행하고 완료를 기다립니다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as runner:
+        return runner.submit(asyncio.run, coro).result()
+
+
+def _find_balanced_json(text: str, open_char: str, start: int = 0) -> Optional[str]:
+    """text의 start 위치 이후 처음 나오는 open_char('[' 또는 '{')부터 짝이 맞는 닫는 괄호까지 반환
+    
+    문자열 리터럴 안의 괄호와 이스케이프 문자는 건너뛰며, 한 번의 순회로 찾습니다.
+    
+    Returns:
+        괄호 짝이 맞는 부분 문자열 (찾지 못하면 None)
+    """
+    start = text.find(open_char, start)
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for pos in range(start, len(text)):
+        char = text[pos]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+            if depth == 0:
+                return text[start:pos + 1]
+    
+    return None
+
+
 class QAGenerator:
     """Q&A 및 SQL 생성 클래스"""
     
@@ -30,7 +223,9 @@ class QAGenerator:
         qa_loader: Optional[QALoader] = None,
         validate_sql: bool = True,
         max_retries: int = 3,
-        logger=None
+        logger=None,
+        requests_per_second: Optional[float] = None,
+        cache_responses: bool = False
     ):
         """
         Args:
@@ -40,6 +235,9 @@ class QAGenerator:
             validate_sql: SQL 유효성 검증 여부
             max_retries: 생성 실패 시 최대 재시도 횟수
             logger: 로거 인스턴스
+            requests_per_second: 초당 최대 모델 요청 수 (None이면 제한 없음)
+            cache_responses: 온도가 0인 모델의 응답을 캐시해 같은 생성기로 다시 실행할 때
+                모델 호출 없이 이전 실행의 응답을 재사용할지 여부 (재실행 시 같은 결과가 나옴)
         """
         self.model = model
         self.schema_loader = schema_loader
@@ -48,6 +246,9 @@ class QAGenerator:
         self.max_retries = max_retries
         self.logger = logger or get_logger(__name__)
         
+        # 모델 요청 속도 제한기 (고정 대기 대신 설정된 속도를 넘을 때만 대기)
+        self._rate_limiter = RateLimiter(requests_per_second)
+        
         # 스키마 정보 로드
         self.schema = self.schema_loader.load_schema()
         self.formatted_schema = self.schema_loader.format_for_prompt()
@@ -70,6 +271,27 @@ class QAGenerator:
             
         # 스키마 어댑터 초기화
         self.schema_adapter = SchemaAdapter(schema_loader=schema_loader)
+        
+        # 모델 응답 캐시: 프롬프트 해시 -> 응답 (병렬 배치에서 공유하므로 잠금 사용, cache_responses일 때만 사용)
+        self.cache_responses = cache_responses
+        self._response_cache: "OrderedDict[Tuple[bytes, int], str]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self._prompt_occurrences: Dict[bytes, int] = {}
+        
+        # 모델 타입과 스키마는 생성기 수명 동안 고정이므로 프롬프트 빌더를 예제 구성별로 재사용
+        # (스키마가 바뀌면 refresh_schema()에서 비움)
+        self._model_type = self.model.__class__.__name__
+        self._prompt_builders: Dict[Tuple[Tuple[str, str, str], ...], PromptBuilder] = {}
+        
+        # 검증용 스키마 테이블 -> 컬럼 목록 (첫 검증 시 계산)
+        # _schema_tables_source: 캐시를 만든 스키마 객체 (self.schema가 다른 객체로 바뀌면 다시 계산)
+        self._schema_tables: Optional[Dict[str, List[str]]] = None
+        self._schema_tables_source: Any = None
+        self._schema_table_names: FrozenSet[str] = frozenset()
+        self._schema_first_table: Optional[str] = None
+        
+        # 기본 Q&A 항목용 테이블 목록과 설명 (첫 사용 시 계산)
+        self._fallback_tables: Optional[Tuple[List[str], Dict[str, str]]] = None
     
     def generate_qa(
         self, 
@@ -77,16 +299,21 @@ class QAGenerator:
         count: int = 10,
         parallel: bool = True,
         max_workers: int = 4,
-        batch_size: int = 5
+        batch_size: int = 5,
+        max_duration: float = 300
     ) -> List[Dict[str, Any]]:
         """지정된 난이도의 Q&A 생성
         
+        요청 수는 제한하지 않으며, 모델 호출 속도는 동시 요청 수(max_workers)와
+        생성기의 요청 속도 제한(requests_per_second)으로 조절합니다.
+        
         Args:
             difficulty: 난이도 ('easy', 'medium', 'hard')
             count: 생성할 항목 수
             parallel: 병렬 처리 여부
             max_workers: 최대 작업자 수 (병렬 처리 시)
             batch_size: 배치 크기 (병렬 처리 시)
+            max_duration: 예상 최대 소요 시간(초), 초과 시 경고 로그 출력
             
         Returns:
             생성된 Q&A 항목 리스트
@@ -96,30 +323,23 @@ class QAGenerator:
             self.logger.warning(f"요청된 항목 수({count})가 0 이하입니다. 빈 리스트를 반환합니다.")
             return []
         
-        # 합리적인 최대값 설정 (필요시 조정)
-        max_count = 50
-        if count > max_count:
-            original_count = count
-            count = max_count
-            self.logger.warning(f"요청된 항목 수({original_count})가 최대 허용치({max_count})를 초과합니다. {count}개로 제한합니다.")
-        
         self.logger.info(f"{difficulty} 난이도의 Q&A {count}개 생성 시작")
         
+        # 응답 캐시의 프롬프트별 요청 순번은 작업 단위로 초기화
+        self._prompt_occurrences.clear()
+        
         # 난이도별 예제 선택
         examples = []
         if self.qa_loader:
             examples = self.qa_loader.get_examples_by_difficulty(difficulty, 3)
+            # 같은 예제 집합이면 항상 같은 순서가 되도록 질문 해시로 정렬 (프롬프트 접두사 고정)
+            examples.sort(key=_example_sort_key)
         
         # 프롬프트 빌더 초기화
-        prompt_builder = PromptBuilder(
-            model_type=self.model.__class__.__name__,
-            schema_formatted=self.formatted_schema,
-            examples=examples
-        )
+        prompt_builder = self._get_prompt_builder(examples)
         
         # 시작 시간 기록 (시간 제한용)
         start_time = time.time()
-        max_duration = 300  # 최대 5분 (필요에 따라 조정)
         
         # 병렬 처리 또는 순차 처리 선택
         if parallel and count > 1:
@@ -164,6 +384,73 @@ class QAGenerator:
         # 일관성을 위해 항상 정확히 요청된 수만큼만 반환
         return items[:count]
     
+    def refresh_schema(self) -> bool:
+        """스키마 로더의 현재 스키마를 다시 읽고, 바뀐 경우 스키마 기반 캐시를 비움
+        
+        스키마 로더가 다른 스키마를 로드한 뒤(예: 데이터 카탈로그에서 다시 로드) 호출합니다.
+        
+        Returns:
+            스키마가 바뀌었는지 여부
+        """
+        schema = self.schema_loader.load_schema()
+        formatted_schema = self.schema_loader.format_for_prompt()
+        if schema == self.schema and formatted_schema == self.formatted_schema:
+            return False
+        
+        self.schema = schema
+        self.formatted_schema = formatted_schema
+        
+        # 프롬프트 빌더와 검증/기본 항목용 테이블 정보는 스키마에서 파생되므로 다시 계산
+        self._prompt_builders.clear()
+        self._schema_tables = None
+        self._schema_table_names = frozenset()
+        self._schema_first_table = None
+        self._fallback_tables = None
+        
+        # 응급 항목 생성용 어댑터도 생성 시점의 스키마를 보관하므로 다시 생성
+        self.schema_adapter = SchemaAdapter(schema_loader=self.schema_loader)
+        
+        if self.sql_validator is not None:
+            try:
+                self.sql_validator = SQLValidator(self.schema_loader)
+            except Exception as e:
+                self.logger.error(f"SQL 검증기 초기화 오류: {str(e)}")
+                self.sql_validator = None
+                self.validate_sql = False
+        
+        self.logger.info("스키마가 변경되어 스키마 기반 캐시를 초기화했습니다.")
+        return True
+    
+    def _get_prompt_builder(self, examples: Optional[List[Dict[str, Any]]] = None) -> PromptBuilder:
+        """예제 구성에 맞는 프롬프트 빌더 반환 (같은 예제 구성이면 이전에 만든 빌더 재사용)
+        
+        Args:
+            examples: 프롬프트에 포함할 예제 리스트
+            
+        Returns:
+            프롬프트 빌더 인스턴스
+        """
+        examples = examples or []
+        key = tuple(
+            (str(example.get("question", "")), str(example.get("sql", "")), str(example.get("answer", "")))
+            for example in examples
+        )
+        
+        prompt_builder = self._prompt_builders.get(key)
+        if prompt_builder is None:
+            # 예제가 매번 달라지는 경우 무한히 쌓이지 않도록 크기 제한
+            if len(self._prompt_builders) >= _PROMPT_BUILDER_CACHE_MAXSIZE:
+                self._prompt_builders.clear()
+            
+            prompt_builder = PromptBuilder(
+                model_type=self._model_type,
+                schema_formatted=self.formatted_schema,
+                examples=examples
+            )
+            self._prompt_builders[key] = prompt_builder
+        
+        return prompt_builder
+    
     def _generate_qa_sequential(
         self, 
         prompt_builder: PromptBuilder, 
@@ -203,11 +490,6 @@ class QAGenerator:
         while remaining > 0 and attempts < max_attempts:
             attempts += 1
             
-            # 목표 개수를 이미 달성했는지 확인 (안전 장치)
-            if len(all_qa_items) >= count:
-                self.logger.info(f"목표 개수 {count}개를 달성했습니다. 생성 종료.")
-                break
-                
             # 최대 빈 응답 횟수 초과 시 중단하고 응급 데이터 생성
             if empty_response_count >= max_empty_responses:
                 self.logger.error(f"최대 빈 응답 횟수({max_empty_responses})를 초과하여 응급 데이터 생성")
@@ -220,18 +502,12 @@ class QAGenerator:
             # 이번 배치에서 생성할 항목 수
             current_batch_size = min(batch_size, remaining)
             
-            # 프롬프트 생성
-            prompts = prompt_builder.build_qa_generation_prompt(
-                difficulty=difficulty,
-                count=current_batch_size
-            )
-            
-            # 모델용 포맷 변환
-            model_inputs = prompt_builder.format_output_for_model(prompts)
+            # 모델용 프롬프트 (같은 배치 크기면 이전 반복에서 만든 입력 재사용)
+            model_inputs = prompt_builder.build_qa_model_inputs(difficulty, current_batch_size)
             
             # 생성 요청
             self.logger.info(f"남은 수량 {remaining}/{count}개 중 {current_batch_size}개 Q&A 생성 중... (시도 {attempts}/{max_attempts})")
-            response, success = self.model.generate_with_retry(
+            response, success = self._generate_cached(
                 prompt=model_inputs.get("prompt", ""),
                 system_prompt=model_inputs.get("system_prompt"),
                 max_retries=self.max_retries
@@ -243,14 +519,16 @@ class QAGenerator:
             if not success:
                 self.logger.error(f"생성 실패: {response}")
                 empty_response_count += 1
-                time.sleep(2)  # 실패 시 대기 시간 추가
+                # API 실패(속도 제한 등)는 더 긴 지수 백오프로 대기
+                time.sleep(backoff_delay(empty_response_count - 1, 1.0))
                 continue
             
             # 응답이 비어있는지 확인
-            if not response or response.strip() == "":
+            if not response or response.isspace():
                 self.logger.error("응답이 비어 있습니다.")
                 empty_response_count += 1
-                time.sleep(2)  # 빈 응답 시 대기 시간 추가
+                # 빈 응답은 짧은 지수 백오프 후 재시도
+                time.sleep(backoff_delay(empty_response_count - 1, 0.5))
                 continue
             
             # 응답이 존재하면 빈 응답 카운터 초기화
@@ -264,26 +542,17 @@ class QAGenerator:
                     # 생성된 항목 검증 및 추가
                     valid_items = self._validate_qa_items(qa_items)
                     
-                    # 필요한 수량만큼만 추가 (초과 항목 제거)
-                    valid_count = min(len(valid_items), remaining)
-                    added_items = valid_items[:valid_count]
-                    
-                    # 항목 추가
-                    all_qa_items.extend(added_items)
-                    
-                    # 충분한 수량이 생성되었는지 확인
-                    generated_count = len(added_items)
+                    # 필요한 수량만큼만 추가 (초과 항목은 복사하지 않고 건너뜀)
+                    generated_count = min(len(valid_items), remaining)
+                    all_qa_items.extend(itertools.islice(valid_items, generated_count))
                     remaining -= generated_count
                     
-                    self.logger.info(f"{generated_count}개 유효한 Q&A 생성 완료 (남은 수량: {remaining}/{count}, 전체 생성: {len(all_qa_items)}/{count})")
+                    self.logger.info(f"{generated_count}개 유효한 Q&A 생성 완료 (남은 수량: {remaining}/{count}, 전체 생성: {count - remaining}/{count})")
                     
-                    # 목표 달성 확인
-                    if remaining <= 0 or len(all_qa_items) >= count:
+                    # 목표 달성 확인 (remaining이 추가된 항목 수를 추적하므로 리스트 길이 재계산 불필요)
+                    if remaining <= 0:
                         self.logger.info(f"목표 개수 {count}개를 달성했습니다. 생성 종료.")
                         break
-                    
-                    # 잠시 대기 (API 제한 고려)
-                    time.sleep(1)
                 else:
                     self.logger.warning("생성된 Q&A 항목이 없습니다. 파싱에 실패했습니다.")
                     
@@ -295,26 +564,20 @@ class QAGenerator:
                             valid_items = self._validate_qa_items([manual_item])
                             
                             # 필요한 수량만큼만 추가
-                            valid_count = min(len(valid_items), remaining)
-                            added_items = valid_items[:valid_count]
-                            
-                            all_qa_items.extend(added_items)
-                            remaining -= len(added_items)
+                            added_count = min(len(valid_items), remaining)
+                            all_qa_items.extend(itertools.islice(valid_items, added_count))
+                            remaining -= added_count
                             
                             # 목표 달성 확인
-                            if remaining <= 0 or len(all_qa_items) >= count:
+                            if remaining <= 0:
                                 self.logger.info(f"목표 개수 {count}개를 달성했습니다. 생성 종료.")
                                 break
                     else:
                         # SQL이 감지되지 않으면 빈 응답으로 처리
                         empty_response_count += 1
-                    
-                    # 대기 시간 추가
-                    time.sleep(2)
             except Exception as e:
                 self.logger.error(f"응답 파싱 오류: {str(e)}")
                 empty_response_count += 1
-                time.sleep(2)
         
         # 최종 결과 확인 및 처리
         final_count = len(all_qa_items)
@@ -362,50 +625,83 @@ class QAGenerator:
             self.logger.info(f"항목 수가 적어({count}개) 순차 처리로 전환합니다.")
             return self._generate_qa_sequential(prompt_builder, difficulty, count)
                 
-        all_qa_items = []
-        
         self.logger.info(f"병렬 처리로 {difficulty} 난이도의 Q&A {count}개 생성 시작")
         
-        # 작업 분할 (더 작은 배치 크기 사용)
-        adjusted_batch_size = min(2, batch_size)  # 배치 크기 제한
+        # 작업 분할 (한 번의 요청으로 여러 항목을 생성해 요청 수와 반복되는 스키마 프롬프트 토큰을 줄임)
+        adjusted_batch_size = max(1, min(batch_size, _MAX_ITEMS_PER_REQUEST))
         total_batches = (count + adjusted_batch_size - 1) // adjusted_batch_size  # 올림 나눗셈
         batch_counts = [adjusted_batch_size] * (total_batches - 1) + [count - adjusted_batch_size * (total_batches - 1)]
         
         # 저장하여 나중에 사용할 수 있도록 total_batches 설정
         self.total_batches = total_batches
         
-        # 병렬 실행
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # partial 함수를 사용하여 추가 인자 전달
-            generate_batch_with_params = partial(
-                self.generate_batch, 
-                prompt_builder=prompt_builder, 
-                difficulty=difficulty
+        # 비동기 병렬 실행 (이벤트 루프 하나에서 모든 배치 요청을 동시에 대기)
+        # 블로킹 모델 호출은 이 작업 전용 스레드 풀에서 실행 (기본 실행기의 스레드 수에 제한되지 않음)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="qa-model") as executor:
+            batch_results = _run_coroutine(
+                self._agenerate_batches(prompt_builder, difficulty, batch_counts, max_workers, executor)
             )
-            
-            futures = [
-                executor.submit(generate_batch_with_params, batch_count, i)
-                for i, batch_count in enumerate(batch_counts)
-            ]
-            
-            # 결과 수집
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    batch_items = future.result()
-                    
-                    remaining = count - len(all_qa_items)
-                    if remaining > 0:
-                        to_add = batch_items[:remaining]
-                        all_qa_items.extend(to_add)
-                        self.logger.info(f"병렬 처리: {len(to_add)}개 항목 추가 (전체: {len(all_qa_items)}/{count})")
-                        
-                        if len(all_qa_items) >= count:
-                            break
-                except Exception as e:
-                    self.logger.error(f"병렬 처리 중 오류 발생: {str(e)}")
+        
+        # 결과 수집 (배치 순서 유지, 배치 결과 리스트를 한 번에 이어 붙여 요청 수만큼만 사용)
+        all_qa_items = list(itertools.islice(itertools.chain.from_iterable(batch_results), count))
+        self.logger.info(f"병렬 처리: {self.total_batches}개 배치에서 {len(all_qa_items)}/{count}개 항목 수집")
         
         return all_qa_items
     
+    async def _agenerate_batches(
+        self,
+        prompt_builder: PromptBuilder,
+        difficulty: str,
+        batch_counts: List[int],
+        max_workers: int,
+        executor: Optional[Executor] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """모든 배치를 동시에 생성 (동시 요청 수는 max_workers로 제한)
+        
+        배치가 요청 수보다 적은 항목을 반환하면 다른 배치를 기다리지 않고 즉시 부족분만큼
+        추가 배치를 보냅니다. 추가 배치는 처음 배치 수의 2배까지만 보냅니다.
+        세마포어는 배치 단위가 아니라 모델 요청마다 획득하므로, 실패한 배치의 단일 항목
+        재시도 요청도 max_workers 제한을 받습니다.
+        
+        Args:
+            executor: 블로킹 모델 호출을 실행할 실행기 (None이면 이벤트 루프의 기본 실행기)
+        
+        Returns:
+            배치 순서대로 정렬된 배치별 결과 리스트
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+        max_batches = len(batch_counts) * 3
+        results: Dict[int, List[Dict[str, Any]]] = {}
+        
+        async def run_batch(batch_count: int, batch_idx: int) -> List[Dict[str, Any]]:
+            return await self._agenerate_batch(batch_count, batch_idx, prompt_builder, difficulty, semaphore, executor)
+        
+        pending = {}
+        for batch_idx, batch_count in enumerate(batch_counts):
+            pending[asyncio.ensure_future(run_batch(batch_count, batch_idx))] = (batch_idx, batch_count)
+        next_idx = len(batch_counts)
+        
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                batch_idx, batch_count = pending.pop(task)
+                try:
+                    batch_items = task.result()
+                except Exception as e:
+                    self.logger.error(f"병렬 처리 중 오류 발생 (배치 {batch_idx+1}): {str(e)}")
+                    batch_items = []
+                results[batch_idx] = batch_items
+                
+                # 부족분은 남은 배치를 기다리지 않고 바로 다시 요청
+                shortfall = batch_count - len(batch_items)
+                if shortfall > 0 and next_idx < max_batches:
+                    self.total_batches = max(self.total_batches, next_idx + 1)
+                    self.logger.info(f"배치 {batch_idx+1}에서 {shortfall}개가 부족하여 추가 배치 {next_idx+1} 요청")
+                    pending[asyncio.ensure_future(run_batch(shortfall, next_idx))] = (next_idx, shortfall)
+                    next_idx += 1
+        
+        return [results[batch_idx] for batch_idx in sorted(results)]
+    
     def generate_batch(self, batch_size: int, batch_idx: int, prompt_builder: PromptBuilder, difficulty: str) -> List[Dict[str, Any]]:
         """배치 단위 Q&A 생성
         
@@ -418,65 +714,63 @@ class QAGenerator:
         Returns:
             생성된 Q&A 항목 리스트
         """
+        return _run_coroutine(self._agenerate_batch(batch_size, batch_idx, prompt_builder, difficulty))
+    
+    async def _agenerate_batch(
+        self,
+        batch_size: int,
+        batch_idx: int,
+        prompt_builder: PromptBuilder,
+        difficulty: str,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        executor: Optional[Executor] = None
+    ) -> List[Dict[str, Any]]:
+        """배치 단위 Q&A 생성 (비동기)
+        
+        Args:
+            semaphore: 모델 요청마다 획득할 동시 요청 수 제한 (None이면 제한 없음)
+            executor: 블로킹 모델 호출을 실행할 실행기 (None이면 이벤트 루프의 기본 실행기)
+        """
         batch_items = []
         self.logger.info(f"배치 {batch_idx+1}/{self.total_batches} 시작 (크기: {batch_size})")
+        
+        # 응답 파싱(정규식/JSON 처리)은 스레드 풀에서 실행해 다른 배치의 요청 대기를 막지 않음
+        loop = asyncio.get_running_loop()
 
         try:
-            # 프롬프트 생성
-            prompts = prompt_builder.build_qa_generation_prompt(
-                difficulty=difficulty,
-                count=batch_size
-            )
-
-            # 모델용 포맷 변환
-            model_inputs = prompt_builder.format_output_for_model(prompts)
+            # 모델용 프롬프트 (같은 크기의 배치끼리 입력 재사용)
+            model_inputs = prompt_builder.build_qa_model_inputs(difficulty, batch_size)
 
             # 생성 요청
-            response, success = self.model.generate_with_retry(
+            response, success = await self._agenerate_cached(
                 prompt=model_inputs.get("prompt", ""),
                 system_prompt=model_inputs.get("system_prompt"),
-                max_retries=self.max_retries
+                max_retries=self.max_retries,
+                semaphore=semaphore,
+                executor=executor
             )
 
-            if not success or not response or response.strip() == "":
+            if not success or not response or response.isspace():
                 self.logger.error(f"배치 {batch_idx+1} 생성 실패 또는 빈 응답")
                 
                 # 단일 항목으로 재시도
                 if batch_size > 1:
                     self.logger.info(f"배치 {batch_idx+1}을 단일 항목으로 재시도합니다")
-                    single_items = []
+                    # 재시도 요청을 모두 먼저 시작한 뒤 결과를 모아 배치 지연을 단일 호출 수준으로 유지
+                    # (각 요청이 세마포어를 획득하므로 동시 요청 수는 max_workers를 넘지 않음)
+                    single_results = await asyncio.gather(
+                        *(self._agenerate_single_item(prompt_builder, difficulty, loop, semaphore, executor)
+                          for _ in range(batch_size))
+                    )
+                    single_items = [item for item in single_results if item is not None]
                     
-                    for i in range(batch_size):
-                        time.sleep(1)  # 재시도 간 대기
-                        single_prompts = prompt_builder.build_qa_generation_prompt(
-                            difficulty=difficulty,
-                            count=1
-                        )
-                        single_inputs = prompt_builder.format_output_for_model(single_prompts)
-                        single_response, single_success = self.model.generate_with_retry(
-                            prompt=single_inputs.get("prompt", ""),
-                            system_prompt=single_inputs.get("system_prompt"),
-                            max_retries=2
-                        )
-                        
-                        if single_success and single_response and single_response.strip():
-                            single_qa_items = self._parse_qa_response(single_response, difficulty)
-                            
-                            if single_qa_items:
-                                valid_items = self._validate_qa_items(single_qa_items)
-                                valid_items = valid_items[:1]  # 각 재시도에서 최대 1개만
-                                single_items.extend(valid_items)
-                                
-                                if len(single_items) >= batch_size:
-                                    break
-
                     self.logger.info(f"단일 항목 재시도로 {len(single_items)}/{batch_size}개 생성")
                     return single_items[:batch_size]
                 
                 return []
 
             # 응답 파싱
-            qa_items = self._parse_qa_response(response, difficulty)
+            qa_items = await loop.run_in_executor(None, self._parse_qa_response, response, difficulty)
             
             if qa_items:
                 valid_items = self._validate_qa_items(qa_items)
@@ -500,66 +794,350 @@ class QAGenerator:
             self.logger.error(f"배치 {batch_idx+1} 처리 중 오류 발생: {str(e)}")
             return []
    
-    def generate_answers(self, qa_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _agenerate_single_item(
+        self,
+        prompt_builder: PromptBuilder,
+        difficulty: str,
+        loop: asyncio.AbstractEventLoop,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        executor: Optional[Executor] = None
+    ) -> Optional[Dict[str, Any]]:
+        """단일 항목 생성 요청 (배치 실패 시 재시도용)
+        
+        Returns:
+            검증을 통과한 첫 번째 Q&A 항목 (실패 시 None)
+        """
+        single_inputs = prompt_builder.build_qa_model_inputs(difficulty, 1)
+        single_response, single_success = await self._agenerate_cached(
+            prompt=single_inputs.get("prompt", ""),
+            system_prompt=single_inputs.get("system_prompt"),
+            max_retries=2,
+            semaphore=semaphore,
+            executor=executor
+        )
+        
+        if not single_success or not single_response or single_response.isspace():
+            return None
+        
+        single_qa_items = await loop.run_in_executor(
+            None, self._parse_qa_response, single_response, difficulty
+        )
+        if not single_qa_items:
+            return None
+        
+        # 각 재시도에서 최대 1개만 사용
+        valid_items = self._validate_qa_items(single_qa_items)
+        return valid_items[0] if valid_items else None
+    
+    def _generate_cached(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_retries: int
+    ) -> Tuple[str, bool]:
+        """응답 캐시를 거치는 모델 생성 요청
+        
+        cache_responses가 켜져 있고 온도가 0인 모델은 같은 프롬프트에 같은 응답을 내므로
+        프롬프트와 생성 파라미터의 해시로 성공한 응답을 캐시해 재실행 시 동일한 요청을
+        다시 보내지 않습니다. 그 외에는 캐시하지 않습니다.
+        
+        Returns:
+            (생성된 텍스트, 성공 여부) 튜플
+        """
+        key, cached = self._lookup_response_cache(prompt, system_prompt)
+        if cached is not None:
+            return cached, True
+        
+        self._rate_limiter.acquire()
+        response, success = self.model.generate_with_retry(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_retries=max_retries
+        )
+        
+        if success and key is not None:
+            self._store_response_cache(key, response)
+        
+        return response, success
+    
+    async def _agenerate_cached(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_retries: int,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        executor: Optional[Executor] = None
+    ) -> Tuple[str, bool]:
+        """응답 캐시를 거치는 모델 생성 요청 (비동기)
+        
+        Args:
+            semaphore: 모델 요청 동안 획득할 동시 요청 수 제한 (None이면 제한 없음,
+                캐시된 응답을 반환할 때는 획득하지 않음)
+            executor: 블로킹 모델 호출을 실행할 실행기 (None이면 이벤트 루프의 기본 실행기)
+        """
+        key, cached = self._lookup_response_cache(prompt, system_prompt)
+        if cached is not None:
+            return cached, True
+        
+        if semaphore is None:
+            response, success = await self._arequest_model(prompt, system_prompt, max_retries, executor)
+        else:
+            async with semaphore:
+                response, success = await self._arequest_model(prompt, system_prompt, max_retries, executor)
+        
+        if success and key is not None:
+            self._store_response_cache(key, response)
+        
+        return response, success
+    
+    async def _arequest_model(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_retries: int,
+        executor: Optional[Executor] = None
+    ) -> Tuple[str, bool]:
+        """속도 제한을 거쳐 모델에 생성 요청 (비동기)"""
+        await self._rate_limiter.aacquire()
+        return await self.model.agenerate_with_retry(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_retries=max_retries,
+            executor=executor
+        )
+    
+    def _lookup_response_cache(
+        self,
+        prompt: str,
+        system_prompt: Optional[str]
+    ) -> Tuple[Optional[Tuple[bytes, int]], Optional[str]]:
+        """응답 캐시 조회
+        
+        Returns:
+            (캐시 키, 캐시된 응답) 튜플 (캐시 대상이 아니면 키가 None, 캐시에 없으면 응답이 None)
+        """
+        model = self.model
+        if not self.cache_responses or getattr(model, "temperature", None) != 0:
+            return None, None
+        
+        # 스키마 크기의 프롬프트를 이어 붙이지 않고 부분별로 해시에 공급
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update((system_prompt or "").encode("utf-8"))
+        hasher.update(b"\x00")
+        hasher.update(prompt.encode("utf-8"))
+        hasher.update(b"\x00")
+        # 같은 프롬프트라도 모델이나 생성 파라미터가 다르면 다른 응답이므로 키에 포함
+        generation_params = (
+            model.__class__.__name__,
+            model.model_name,
+            getattr(model, "max_tokens", None),
+            getattr(model, "top_p", None),
+            sorted(model.kwargs.items()) if isinstance(getattr(model, "kwargs", None), dict) else None,
+        )
+        hasher.update(repr(generation_params).encode("utf-8"))
+        prompt_hash = hasher.digest()
+        
+        with self._response_cache_lock:
+            # 한 작업 안에서 같은 프롬프트를 반복 요청하는 것은 새 항목이 필요해서이므로
+            # 몇 번째 요청인지를 키에 포함 (재실행 시 같은 순번의 응답을 재사용)
+            occurrence = self._prompt_occurrences.get(prompt_hash, 0)
+            self._prompt_occurrences[prompt_hash] = occurrence + 1
+            key = (prompt_hash, occurrence)
+            
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+                self.logger.debug("캐시된 모델 응답 사용")
+        
+        return key, cached
+    
+    def _store_response_cache(self, key: Tuple[bytes, int], response: str) -> None:
+        """성공한 모델 응답을 캐시에 저장 (최대 크기를 넘으면 가장 오래된 항목 제거)"""
+        with self._response_cache_lock:
+            self._response_cache[key] = response
+            if len(self._response_cache) > _RESPONSE_CACHE_MAXSIZE:
+                self._response_cache.popitem(last=False)
+    
+    def generate_answers(
+        self, 
+        qa_items: List[Dict[str, Any]],
+        batch_size: int = 5,
+        max_workers: int = 4
+    ) -> List[Dict[str, Any]]:
         """답변이 없는 Q&A 항목에 대한 답변 생성
         
+        답변이 필요한 항목을 batch_size개씩 묶어 한 번의 요청으로 답변을 생성하고,
+        묶음 응답에서 답변을 찾지 못한 항목만 개별 요청으로 다시 생성합니다.
+        
         Args:
             qa_items: 답변을 생성할 Q&A 항목 리스트
+            batch_size: 한 번의 요청으로 답변을 생성할 항목 수
+            max_workers: 동시에 처리할 최대 요청 수
             
         Returns:
             답변이 추가된 Q&A 항목 리스트
         """
-        result_items = []
+        self._prompt_occurrences.clear()
         
-        # 프롬프트 빌더 초기화
-        prompt_builder = PromptBuilder(
-            model_type=self.model.__class__.__name__,
-            schema_formatted=self.formatted_schema
-        )
+        # 답변이 이미 있는 항목은 그대로 유지
+        pending = [item for item in qa_items if not (item.get("answer") and item["answer"].strip())]
         
-        for item in qa_items:
-            # 답변이 이미 있으면 그대로 유지
-            if item.get("answer") and item["answer"].strip():
-                result_items.append(item)
-                continue
+        if pending:
+            # 프롬프트 빌더 초기화
+            prompt_builder = self._get_prompt_builder()
             
-            # 답변 생성 프롬프트 구성
-            prompts = prompt_builder.build_answer_generation_prompt(
-                question=item["question"],
-                sql=item["sql"]
-            )
-            
-            # 모델용 포맷 변환
+            batch_size = max(1, batch_size)
+            batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            # 블로킹 모델 호출은 이 작업 전용 스레드 풀에서 실행 (기본 실행기의 스레드 수에 제한되지 않음)
+            with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="qa-model") as executor:
+                _run_coroutine(self._agenerate_answer_batches(prompt_builder, batches, max_workers, executor))
+        
+        # 항목은 제자리에서 수정되므로 입력 순서 그대로 반환
+        return list(qa_items)
+    
+    async def _agenerate_answer_batches(
+        self,
+        prompt_builder: PromptBuilder,
+        batches: List[List[Dict[str, Any]]],
+        max_workers: int,
+        executor: Optional[Executor] = None
+    ) -> None:
+        """답변 묶음들을 동시에 생성 (동시 요청 수는 max_workers로 제한)
+        
+        세마포어는 모델 요청마다 획득하므로 묶음 응답에서 누락된 항목의 개별 요청도
+        max_workers 제한을 받습니다.
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+        await asyncio.gather(
+            *(self._agenerate_answer_batch(prompt_builder, batch, semaphore, executor) for batch in batches)
+        )
+    
+    async def _agenerate_answer_batch(
+        self,
+        prompt_builder: PromptBuilder,
+        batch: List[Dict[str, Any]],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        executor: Optional[Executor] = None
+    ) -> None:
+        """항목 묶음의 답변을 한 번의 요청으로 생성하고 누락된 항목은 개별 생성"""
+        answers: Dict[int, str] = {}
+        
+        if len(batch) > 1:
+            prompts = prompt_builder.build_batch_answer_generation_prompt(batch)
             model_inputs = prompt_builder.format_output_for_model(prompts)
             
-            # 생성 요청
-            self.logger.info(f"질문에 대한 답변 생성 중: {item['question'][:50]}...")
-            response, success = self.model.generate_with_retry(
+            self.logger.info(f"질문 {len(batch)}개에 대한 답변 일괄 생성 중...")
+            response, success = await self._agenerate_cached(
                 prompt=model_inputs.get("prompt", ""),
                 system_prompt=model_inputs.get("system_prompt"),
-                max_retries=self.max_retries
+                max_retries=self.max_retries,
+                semaphore=semaphore,
+                executor=executor
             )
             
             if success:
-                # 답변 추가
-                item["answer"] = response.strip()
-                result_items.append(item)
+                answers = self._parse_batch_answers(response, len(batch))
+            else:
+                self.logger.error(f"답변 일괄 생성 실패: {response}")
+        
+        missing = []
+        for index, item in enumerate(batch, 1):
+            answer = answers.get(index)
+            if answer:
+                item["answer"] = answer
             else:
-                self.logger.error(f"답변 생성 실패: {response}")
-                # 실패 시 빈 답변 추가
-                item["answer"] = ""
-                result_items.append(item)
+                missing.append(item)
+        
+        # 묶음 응답에서 찾지 못한 항목은 개별 요청을 동시에 보내 생성 (요청마다 세마포어 획득)
+        if missing:
+            await asyncio.gather(*(self._agenerate_answer(prompt_builder, item, semaphore, executor) for item in missing))
+    
+    async def _agenerate_answer(
+        self,
+        prompt_builder: PromptBuilder,
+        item: Dict[str, Any],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        executor: Optional[Executor] = None
+    ) -> None:
+        """단일 항목의 답변 생성 (항목을 제자리에서 수정)"""
+        # 답변 생성 프롬프트 구성
+        prompts = prompt_builder.build_answer_generation_prompt(
+            question=item["question"],
+            sql=item["sql"]
+        )
+        
+        # 모델용 포맷 변환
+        model_inputs = prompt_builder.format_output_for_model(prompts)
+        
+        # 생성 요청
+        self.logger.info(f"질문에 대한 답변 생성 중: {item['question'][:50]}...")
+        response, success = await self._agenerate_cached(
+            prompt=model_inputs.get("prompt", ""),
+            system_prompt=model_inputs.get("system_prompt"),
+            max_retries=self.max_retries,
+            semaphore=semaphore,
+            executor=executor
+        )
+        
+        if success:
+            # 답변 추가
+            item["answer"] = response.strip()
+        else:
+            self.logger.error(f"답변 생성 실패: {response}")
+            # 실패 시 빈 답변 추가
+            item["answer"] = ""
+    
+    def _parse_batch_answers(self, response: str, count: int) -> Dict[int, str]:
+        """일괄 답변 응답에서 항목 번호별 답변 추출
+        
+        Args:
+            response: 모델 응답 텍스트
+            count: 요청한 항목 수
             
-            # API 제한 고려 대기
-            time.sleep(0.5)
+        Returns:
+            항목 번호(1부터 시작) -> 답변 딕셔너리 (찾지 못한 항목은 제외)
+        """
+        # JSON 코드 블록이 있으면 그 내용을, 없으면 가장 바깥쪽 배열 부분을 사용
+        block_start = response.find("```json")
+        block_end = response.find("```", block_start + 7) if block_start != -1 else -1
+        if block_end != -1:
+            json_content = response[block_start + 7:block_end].strip()
+        else:
+            json_content = response[response.find("["):response.rfind("]") + 1]
         
-        return result_items
+        try:
+            parsed = json_utils.loads(json_content)
+        except (json_utils.JSONDecodeError, ValueError):
+            self.logger.warning("일괄 답변 응답을 JSON으로 파싱할 수 없어 개별 생성으로 전환합니다.")
+            return {}
+        
+        if isinstance(parsed, dict):
+            parsed = [parsed]
+        if not isinstance(parsed, list):
+            return {}
+        
+        answers = {}
+        for position, entry in enumerate(parsed, 1):
+            if not isinstance(entry, dict):
+                continue
+            
+            # 항목 번호가 없거나 잘못된 경우 응답 내 순서를 번호로 사용
+            index = entry.get("index", position)
+            if not isinstance(index, int) or not 1 <= index <= count:
+                index = position
+            
+            answer = entry.get("answer")
+            if isinstance(answer, str) and answer.strip():
+                answers.setdefault(index, answer.strip())
+        
+        return answers
     
     def save_results(
         self, 
         qa_items: List[Dict[str, Any]],
         output_path: Union[str, Path],
-        format: str = 'json'
+        format: str = 'json',
+        indent: bool = True
     ) -> Path:
         """생성된 Q&A 항목 저장
         
@@ -567,6 +1145,7 @@ class QAGenerator:
             qa_items: 저장할 Q&A 항목 리스트
             output_path: 출력 경로
             format: 출력 형식 ('json', 'csv', 'excel')
+            indent: JSON 들여쓰기 여부 (False이면 공백 없는 압축 형식으로 저장)
             
         Returns:
             저장된 파일 경로
@@ -576,7 +1155,7 @@ class QAGenerator:
             self.qa_loader = QALoader()
         
         output_path = Path(output_path)
-        self.qa_loader.save_qa_data(qa_items, output_path, format)
+        self.qa_loader.save_qa_data(qa_items, output_path, format, indent=indent)
         
         self.logger.info(f"{len(qa_items)}개 Q&A 항목이 {output_path}에 저장되었습니다.")
         return output_path
@@ -601,25 +1180,16 @@ class QAGenerator:
             # 오류 발생 시 빈 리스트 반환하여 디폴트 질문 생성 방지
             return []
         
-    def _create_fallback_qa_items(self, difficulty: str, count: int) -> List[Dict[str, Any]]:
-        """스키마 어댑터가 실패할 경우 사용할 사용자 친화적인 기본 Q&A 항목 생성
+    def _get_fallback_tables(self) -> Tuple[List[str], Dict[str, str]]:
+        """기본 Q&A 항목용 테이블 목록과 사용자 친화적 설명 (첫 호출 시 추출 후 재사용)"""
+        if self._fallback_tables is not None:
+            return self._fallback_tables
         
-        Args:
-            difficulty: 난이도
-            count: 생성할 항목 수
-            
-        Returns:
-            기본 Q&A 항목 리스트
-        """
-        self.logger.warning(f"기본 Q&A 항목 {count}개 생성")
-        items = []
-        
-        # 스키마에서 테이블 목록과 설명 추출 시도
         tables = []
         table_descriptions = {}
         
         try:
-            schema = self.schema_loader.load_schema()
+            schema = self.schema
             if isinstance(schema, dict) and 'tables' in schema:
                 for table in schema.get('tables', []):
                     table_name = table.get('name', '')
@@ -636,20 +1206,15 @@ class QAGenerator:
                             table_descriptions[table_name] = user_friendly_name
             elif isinstance(schema, str):
                 # 문자열 형태의 스키마에서 테이블 추출
-                table_pattern = r'CREATE\s+TABLE\s+(?:\w+\.)?(\w+)'
-                tables = re.findall(table_pattern, schema, re.IGNORECASE)
+                tables = _CREATE_TABLE_RE.findall(schema)
                 
                 # 테이블명을 사용자 친화적으로 변환
                 for table in tables:
                     table_descriptions[table] = table.replace('_', ' ').title()
         except Exception:
-            # 추출 실패 시 기본 테이블 사용
-            tables = ['customers', 'orders']
-            table_descriptions = {
-                'customers': '고객',
-                'orders': '주문'
-            }
+            tables = []
         
+        # 추출 실패 시 기본 테이블 사용
         if not tables:
             tables = ['customers', 'orders']
             table_descriptions = {
@@ -657,6 +1222,27 @@ class QAGenerator:
                 'orders': '주문'
             }
         
+        self._fallback_tables = (tables, table_descriptions)
+        return self._fallback_tables
+    
+    def _create_fallback_qa_items(self, difficulty: str, count: int) -> List[Dict[str, Any]]:
+        """스키마 어댑터가 실패할 경우 사용할 사용자 친화적인 기본 Q&A 항목 생성
+        
+        Args:
+            difficulty: 난이도
+            count: 생성할 항목 수
+            
+        Returns:
+            기본 Q&A 항목 리스트
+        """
+        import random  # 스키마 어댑터가 실패한 경우에만 필요하므로 지연 임포트
+        
+        self.logger.warning(f"기본 Q&A 항목 {count}개 생성")
+        items = []
+        
+        # 스키마의 테이블 목록과 설명 (첫 호출 시 한 번만 추출)
+        tables, table_descriptions = self._get_fallback_tables()
+        
         # 템플릿 - 기술적 질문과 사용자 친화적 질문 모두 포함
         templates = {
             'easy': [
@@ -674,27 +1260,22 @@ class QAGenerator:
         # 선택된 난이도의 템플릿 목록
         selected_templates = templates.get(difficulty.lower(), templates['easy'])
         
+        # 항목별 템플릿/테이블을 한 번에 추첨하고, 70% 확률로 사용자 친화적 질문 사용
+        template_picks = random.choices(selected_templates, k=count)
+        table_picks = random.choices(tables, k=count)
+        user_friendly_flags = [random.random() < 0.7 for _ in range(count)]
+        
         # 각 항목 생성
-        for i in range(count):
-            # 랜덤하게 템플릿 선택
-            template, tech_question, user_question, answer_template = random.choice(selected_templates)
-            
-            # 테이블 선택
-            table = random.choice(tables)
+        for (template, tech_question, user_question, answer_template), table, use_user_friendly in zip(
+            template_picks, table_picks, user_friendly_flags
+        ):
             table_desc = table_descriptions.get(table, table.replace('_', ' ').title())
             
-            # 70% 확률로 사용자 친화적 질문 사용
-            use_user_friendly = random.random() < 0.7
-            
-            # 템플릿 채우기
-            sql = template.replace("{table}", table)
-            
-            if use_user_friendly:
-                question = user_question.replace("{table}", table).replace("{table_desc}", table_desc)
-            else:
-                question = tech_question.replace("{table}", table)
-                
-            answer = answer_template.replace("{table}", table).replace("{table_desc}", table_desc)
+            # 템플릿 채우기 (자리 표시자를 한 번의 순회로 치환)
+            placeholders = {"table": table, "table_desc": table_desc}
+            sql = template.format_map(placeholders)
+            question = (user_question if use_user_friendly else tech_question).format_map(placeholders)
+            answer = answer_template.format_map(placeholders)
             
             # 항목 추가
             items.append({
@@ -720,20 +1301,16 @@ class QAGenerator:
         """
         self.logger.debug("텍스트에서 Q&A 항목 추출 시도 중")
         
-        # 질문, SQL, 답변을 추출하기 위한 패턴 개선
-        question_pattern = r'(?:질문|question):?\s*(.*?)(?=(?:SQL|sql|쿼리|query):|<br>|\n\n|$)'
-        sql_pattern = r'(?:SQL|sql|쿼리|query):?\s*(?:```sql)?\s*(.*?)(?:```|\n\n(?:답변|answer):|<br>|$)'
-        answer_pattern = r'(?:답변|answer|결과):?\s*(.*?)(?=\n\n(?:질문|question):|<br>|\n\n|$)'
-        
         # 전체 텍스트에서 질문/SQL/답변 패턴 찾기
-        questions = re.findall(question_pattern, text, re.DOTALL)
-        sqls = re.findall(sql_pattern, text, re.DOTALL)
-        answers = re.findall(answer_pattern, text, re.DOTALL)
+        # (각 패턴은 레이블 문자열로 시작하므로 레이블이 없으면 정규식 탐색 생략)
+        questions = _TEXT_QUESTION_RE.findall(text) if _contains_any(text, _QUESTION_LABELS) else []
+        sqls = _TEXT_SQL_RE.findall(text) if _contains_any(text, _SQL_LABELS) else []
+        answers = _TEXT_ANSWER_RE.findall(text) if _contains_any(text, _ANSWER_LABELS) else []
         
         # SQL 쿼리 직접 추출 시도
         if not sqls:
             # SELECT와 FROM을 포함하는 문자열 찾기
-            sql_direct_matches = re.findall(r'(SELECT\s+.*?FROM\s+.*?(?:;|$))', text, re.IGNORECASE | re.DOTALL)
+            sql_direct_matches = _find_select_statements(text)
             if sql_direct_matches:
                 sqls = sql_direct_matches
                 if not questions:
@@ -777,7 +1354,7 @@ class QAGenerator:
                 elif section.lower().startswith("sql") or section.lower().startswith("쿼리") or section.lower().startswith("query"):
                     # SQL 코드 블록 처리
                     sql = section.split(":", 1)[1].strip() if ":" in section else section
-                    sql = re.sub(r'```sql|```', '', sql).strip()
+                    sql = _strip_sql_fences(sql)
                 elif section.lower().startswith("답변") or section.lower().startswith("answer"):
                     answer = section.split(":", 1)[1].strip() if ":" in section else section
             
@@ -799,7 +1376,7 @@ class QAGenerator:
                 self.logger.info("SQL만으로 항목 추출 성공")
             else:
                 # 마지막 시도: 전체 텍스트에서 SQL 쿼리 패턴 찾기
-                sql_blocks = re.findall(r'```sql\s*(.*?)\s*```', text, re.DOTALL)
+                sql_blocks = _TEXT_SQL_BLOCK_RE.findall(text)
                 if sql_blocks:
                     for i, sql in enumerate(sql_blocks):
                         items.append({
@@ -812,16 +1389,15 @@ class QAGenerator:
         
         return items
 
-    def _validate_qa_items(self, qa_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """생성된 Q&A 항목 검증 - 상세 로깅 추가
+    def _get_schema_tables(self) -> Dict[str, List[str]]:
+        """검증용 스키마 테이블 -> 컬럼 목록 (첫 호출 시 분석 후 재사용)
         
-        Args:
-            qa_items: 검증할 Q&A 항목 리스트
-            
-        Returns:
-            유효한 Q&A 항목 리스트
+        refresh_schema()를 거치지 않고 self.schema에 다른 객체를 대입한 경우에도
+        캐시를 만든 스키마 객체와 비교해 다시 분석합니다.
         """
-        valid_items = []
+        schema = getattr(self, 'schema', None)
+        if self._schema_tables is not None and self._schema_tables_source is schema:
+            return self._schema_tables
         
         # 스키마 정보 로깅
         self.logger.info("=== 스키마 정보 분석 시작 ===")
@@ -839,20 +1415,19 @@ class QAGenerator:
                             schema_tables[table_name] = columns
                 elif isinstance(self.schema, str):
                     # 문자열 형태의 스키마에서 테이블명과 컬럼 추출 시도
-                    table_pattern = r'CREATE\s+TABLE\s+(?:\w+\.)?(\w+)'
-                    table_names = re.findall(table_pattern, self.schema, re.IGNORECASE)
+                    table_names = _CREATE_TABLE_RE.findall(self.schema)
                     
                     # 각 테이블의 컬럼 추출 (단순화된 방식)
+                    # 테이블마다 스키마 전체를 다시 검색하지 않도록 정의부를 한 번에 수집
+                    # (같은 이름이 여러 번 정의되면 첫 번째 정의 사용)
+                    table_columns = {}
+                    for table_def in _TABLE_DEF_RE.finditer(self.schema):
+                        table_columns.setdefault(
+                            table_def.group(1).lower(), _COLUMN_NAME_RE.findall(table_def.group(2))
+                        )
+                    
                     for table_name in table_names:
-                        column_pattern = r'CREATE\s+TABLE\s+(?:\w+\.)?{0}\s*\((.*?)\)'.format(re.escape(table_name))
-                        column_matches = re.search(column_pattern, self.schema, re.IGNORECASE | re.DOTALL)
-                        
-                        if column_matches:
-                            column_text = column_matches.group(1)
-                            column_names = re.findall(r'[\s,](\w+)[\s\n]+', column_text)
-                            schema_tables[table_name] = column_names
-                        else:
-                            schema_tables[table_name] = []
+                        schema_tables[table_name] = table_columns.get(table_name.lower(), [])
                 
                 # 스키마 정보 로깅
                 if schema_tables:
@@ -866,80 +1441,119 @@ class QAGenerator:
         
         self.logger.info("=== 스키마 정보 분석 완료 ===")
         
+        # 테이블명 대소문자와 무관하게 사용 여부를 빠르게 확인하기 위한 집합
+        self._schema_table_names = frozenset(name.lower() for name in schema_tables)
+        # 잘못된 테이블명을 대체할 스키마의 첫 번째 테이블
+        self._schema_first_table = next(iter(schema_tables), None)
+        self._schema_tables = schema_tables
+        self._schema_tables_source = schema
+        return schema_tables
+    
+    def _validate_qa_items(self, qa_items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """생성된 Q&A 항목 검증 - 상세 로깅 추가
+        
+        Args:
+            qa_items: 검증할 Q&A 항목 (리스트 또는 한 번만 순회 가능한 이터러블)
+            
+        Returns:
+            유효한 Q&A 항목 리스트
+        """
+        valid_items = []
+        
+        # 스키마의 테이블/컬럼 목록 (스키마는 고정이므로 첫 검증 시 한 번만 분석)
+        schema_tables = self._get_schema_tables()
+        schema_table_names = self._schema_table_names
+        
         # 항목 검증
-        total_items = len(qa_items)
+        # 이터러블은 개수를 미리 알 수 없으므로 순회하면서 센 개수를 요약에 사용
+        total_items = len(qa_items) if isinstance(qa_items, Sized) else "?"
         self.logger.info(f"=== 항목 검증 시작 ({total_items}개) ===")
         
+        # 항목별 진행 로그는 DEBUG 수준에서만 기록 (비활성화 시 메시지 포맷팅도 생략)
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        log_debug = self.logger.debug
+        # 잘못된 테이블을 쓴 항목마다 기록하는 사용 가능한 테이블 목록은 한 번만 만들어 재사용
+        available_tables = ', '.join(schema_tables) if debug_enabled else ''
+        
+        idx = -1
         for idx, item in enumerate(qa_items):
-            self.logger.info(f"[항목 {idx+1}/{total_items}] 검증 시작")
+            if debug_enabled:
+                log_debug("[항목 %d/%s] 검증 시작", idx + 1, total_items)
             
             # 필수 필드 확인
-            if not all(key in item for key in ["question", "sql"]):
+            if not isinstance(item, dict) or not _REQUIRED_QA_KEYS <= item.keys():
                 self.logger.warning(f"[항목 {idx+1}] 필수 필드 누락")
                 continue
             
             # SQL 로깅
-            sql = item["sql"]
-            sql_clean = re.sub(r'```sql|```', '', sql).strip()
+            sql_facts = _extract_sql_facts(item["sql"])
+            sql_clean = sql_facts.clean
             item["sql"] = sql_clean  # 정리된 SQL 저장
             
-            self.logger.info(f"[항목 {idx+1}] SQL: {sql_clean}")
+            if debug_enabled:
+                log_debug("[항목 %d] SQL: %s", idx + 1, sql_clean)
             
             # SQL이 실제로 SQL인지 확인
-            if "SELECT" not in sql_clean.upper() or "FROM" not in sql_clean.upper():
+            if not sql_facts.has_keywords:
                 self.logger.warning(f"[항목 {idx+1}] SQL 문법 확인 실패 - SELECT 또는 FROM 키워드 없음")
                 continue
             
-            # 테이블 사용 분석
-            used_tables = []
-            from_match = re.findall(r'FROM\s+([a-zA-Z0-9_]+)', sql_clean, re.IGNORECASE)
-            join_match = re.findall(r'JOIN\s+([a-zA-Z0-9_]+)', sql_clean, re.IGNORECASE)
+            # 테이블 사용 분석 (같은 테이블이 여러 번 나와도 한 번만 확인, 등장 순서 유지)
+            used_tables = sql_facts.used_tables
             
-            if from_match:
-                used_tables.extend(from_match)
-            if join_match:
-                used_tables.extend(join_match)
+            # 같은 SQL을 검증기로 두 번 검사하지 않도록 결과 보관
+            validation_result = None
             
             # 테이블 유효성 검사
             if schema_tables:
-                invalid_tables = [table for table in used_tables if table not in schema_tables]
+                # SQL 식별자는 대소문자를 구분하지 않으므로 소문자 집합으로 확인
+                # (대소문자만 다른 테이블명 때문에 검증기를 호출하거나 다른 테이블로 바꾸지 않음)
+                invalid_tables = [table for table in used_tables if table.lower() not in schema_table_names]
                 if invalid_tables:
                     self.logger.warning(f"[항목 {idx+1}] 유효하지 않은 테이블 사용: {', '.join(invalid_tables)}")
-                    self.logger.info(f"[항목 {idx+1}] 사용 가능한 테이블: {', '.join(schema_tables.keys())}")
+                    if debug_enabled:
+                        log_debug("[항목 %d] 사용 가능한 테이블: %s", idx + 1, available_tables)
                     
                     # SQL 검증기 사용 시도
                     if self.validate_sql and self.sql_validator:
                         validation_result = self.sql_validator.validate_sql(sql_clean)
                         corrected_sql = validation_result.get("corrected_sql")
                         if corrected_sql:
-                            self.logger.info(f"[항목 {idx+1}] SQL 자동 수정 적용: {corrected_sql}")
+                            if debug_enabled:
+                                log_debug("[항목 %d] SQL 자동 수정 적용: %s", idx + 1, corrected_sql)
                             item["sql"] = corrected_sql
                             valid_items.append(item)
-                            self.logger.info(f"[항목 {idx+1}] 검증 완료 - 수정 후 추가됨")
+                            if debug_enabled:
+                                log_debug("[항목 %d] 검증 완료 - 수정 후 추가됨", idx + 1)
                             continue
                     
-                    # 검증 실패하고 수정도 되지 않았으면 대체 테이블 사용
-                    sql_fixed = sql_clean
-                    for bad_table in invalid_tables:
-                        # 스키마의 첫 번째 테이블로 대체
-                        if schema_tables:
-                            replacement = next(iter(schema_tables.keys()))
-                            sql_fixed = re.sub(r'\b{0}\b'.format(re.escape(bad_table)), replacement, sql_fixed, flags=re.IGNORECASE)
+                    # 검증 실패하고 수정도 되지 않았으면 잘못된 테이블을 모두 스키마의 첫 번째 테이블로
+                    # 한 번에 대체 (테이블마다 정규식을 새로 만들어 SQL을 반복 치환하지 않음)
+                    replacement = self._schema_first_table
+                    bad_table_re = re.compile(
+                        r'\b(?:{0})\b'.format('|'.join(re.escape(table) for table in invalid_tables)),
+                        re.IGNORECASE
+                    )
+                    sql_fixed = bad_table_re.sub(lambda match: replacement, sql_clean)
                     
                     if sql_fixed != sql_clean:
-                        self.logger.info(f"[항목 {idx+1}] SQL 수동 수정 적용: {sql_fixed}")
+                        if debug_enabled:
+                            log_debug("[항목 %d] SQL 수동 수정 적용: %s", idx + 1, sql_fixed)
                         item["sql"] = sql_fixed
                         valid_items.append(item)
-                        self.logger.info(f"[항목 {idx+1}] 검증 완료 - 수동 수정 후 추가됨")
+                        if debug_enabled:
+                            log_debug("[항목 %d] 검증 완료 - 수동 수정 후 추가됨", idx + 1)
                         continue
-                else:
-                    self.logger.info(f"[항목 {idx+1}] 테이블 유효성 확인 성공: {', '.join(used_tables)}")
+                elif debug_enabled:
+                    log_debug("[항목 %d] 테이블 유효성 확인 성공: %s", idx + 1, ', '.join(used_tables))
             
             # SQL 검증기로 검증 (있는 경우)
             if self.validate_sql and self.sql_validator:
-                self.logger.info(f"[항목 {idx+1}] SQL 검증기 실행 중...")
+                if debug_enabled:
+                    log_debug("[항목 %d] SQL 검증기 실행 중...", idx + 1)
                 try:
-                    validation_result = self.sql_validator.validate_sql(sql_clean)
+                    if validation_result is None:
+                        validation_result = self.sql_validator.validate_sql(sql_clean)
                     
                     if not validation_result["is_valid"]:
                         errors = validation_result.get("errors", [])
@@ -949,138 +1563,216 @@ class QAGenerator:
                         # 수정된 SQL이 있는 경우
                         corrected_sql = validation_result.get("corrected_sql")
                         if corrected_sql:
-                            self.logger.info(f"[항목 {idx+1}] SQL 수정됨: {corrected_sql}")
+                            if debug_enabled:
+                                log_debug("[항목 %d] SQL 수정됨: %s", idx + 1, corrected_sql)
                             item["sql"] = corrected_sql
                             valid_items.append(item)
-                            self.logger.info(f"[항목 {idx+1}] 검증 완료 - 수정 후 추가됨")
+                            if debug_enabled:
+                                log_debug("[항목 %d] 검증 완료 - 수정 후 추가됨", idx + 1)
                             continue
                     else:
-                        self.logger.info(f"[항목 {idx+1}] SQL 검증 성공")
+                        if debug_enabled:
+                            log_debug("[항목 %d] SQL 검증 성공", idx + 1)
                         valid_items.append(item)
-                        self.logger.info(f"[항목 {idx+1}] 검증 완료 - 추가됨")
+                        if debug_enabled:
+                            log_debug("[항목 %d] 검증 완료 - 추가됨", idx + 1)
                         continue
                 except Exception as e:
                     self.logger.error(f"[항목 {idx+1}] SQL 검증 중 오류 발생: {str(e)}")
             
             # 검증기를 사용하지 않거나 검증 중 오류가 발생한 경우 기본 검사 통과 항목만 추가
             valid_items.append(item)
-            self.logger.info(f"[항목 {idx+1}] 기본 검증 완료 - 추가됨")
+            if debug_enabled:
+                log_debug("[항목 %d] 기본 검증 완료 - 추가됨", idx + 1)
             
-            self.logger.info(f"[항목 {idx+1}/{total_items}] 검증 완료")
+            if debug_enabled:
+                log_debug("[항목 %d/%s] 검증 완료", idx + 1, total_items)
         
         # 로그 요약
         added_count = len(valid_items)
-        self.logger.info(f"=== 항목 검증 완료: {added_count}/{total_items} 항목 추가됨 ===")
+        self.logger.info(f"=== 항목 검증 완료: {added_count}/{idx + 1} 항목 추가됨 ===")
         
         return valid_items
     
-    def _parse_qa_response(self, response: str, difficulty: str) -> List[Dict[str, Any]]:
+    def _finalize_parsed_items(self, parsed: Any, difficulty: str) -> List[Dict[str, Any]]:
+        """파싱된 JSON을 Q&A 항목 리스트로 정리
+        
+        Args:
+            parsed: 파싱된 JSON (항목 리스트 또는 단일 항목)
+            difficulty: 항목에 난이도가 없을 때 사용할 난이도
+            
+        Returns:
+            Q&A 항목 리스트 (객체가 아닌 항목은 제외, 유효한 항목이 없으면 빈 리스트)
+        """
+        # 단일 항목인 경우 리스트로 변환
+        if isinstance(parsed, dict):
+            qa_items = [parsed]
+        elif isinstance(parsed, list):
+            qa_items = [item for item in parsed if isinstance(item, dict)]
+            if len(qa_items) < len(parsed):
+                self.logger.warning(f"JSON 배열에서 객체가 아닌 항목 {len(parsed) - len(qa_items)}개 제외")
+        else:
+            qa_items = []
+        
+        # 각 항목에 누락된 정보 추가 (응답마다 새로 만들어지는 난이도 문자열은 공유 객체로 교체)
+        for item in qa_items:
+            item_difficulty = item.get("difficulty")
+            if item_difficulty is None:
+                item["difficulty"] = difficulty
+            elif isinstance(item_difficulty, str):
+                item["difficulty"] = sys.intern(item_difficulty)
+        
+        if qa_items:
+            self.logger.info(f"JSON에서 {len(qa_items)}개 항목 추출 성공")
+        return qa_items
+    
+    def _parse_qa_response(self, response: Union[str, bytes], difficulty: str) -> List[Dict[str, Any]]:
         """모델 응답에서 Q&A 항목 파싱
         
         Args:
-            response: 모델 응답 텍스트
+            response: 모델 응답 텍스트 (UTF-8 바이트도 허용)
             difficulty: 난이도
             
         Returns:
             파싱된 Q&A 항목 리스트
         """
+        # 바이트 응답은 한 번만 디코딩 (텍스트 기반 대체 파싱에도 문자열이 필요)
+        if isinstance(response, bytes):
+            response = response.decode('utf-8', errors='replace')
+        
         try:
             # 응답이 비어있는 경우 처리
-            if not response or response.strip() == "":
+            if not response or response.isspace():
                 self.logger.error("응답이 비어 있습니다.")
                 return []
                     
             # 응답 로깅 (디버깅 목적)
             self.logger.debug(f"파싱할 응답: {response[:500]}...")
             
-            # JSON 응답 추출 시도
+            # 0. 대부분의 응답은 그 자체로 JSON이므로 코드 블록/괄호 탐색 전에 바로 파싱 시도
+            stripped = response.strip()
+            if stripped[:1] in ("[", "{"):
+                try:
+                    parsed = json_utils.loads(stripped)
+                except json_utils.JSONDecodeError:
+                    pass
+                else:
+                    qa_items = self._finalize_parsed_items(parsed, difficulty)
+                    if qa_items:
+                        self.logger.debug("전체 응답이 JSON으로 처리됨")
+                        return qa_items
+            
+            # JSON 응답 추출 시도 (유효성 확인 중 이미 파싱한 결과는 재사용)
             json_content = None
+            parsed = None
             
-            # 1. 정규식으로 JSON 블록 찾기 시도
-            json_match = re.search(r'```json\s*([\s\S]*?)\s*```', response)
-            if json_match:
-                json_content = json_match.group(1).strip()
+            # 1. JSON 코드 블록 찾기 시도 (정규식 대신 str.find로 구분자 위치만 탐색)
+            block_start = response.find("```json")
+            block_end = response.find("```", block_start + 7) if block_start != -1 else -1
+            if block_end != -1:
+                json_content = response[block_start + 7:block_end].strip()
                 self.logger.debug("JSON 코드 블록에서 콘텐츠 추출됨")
             else:
                 # 2. 추가: ```와 ``` 사이의 모든 텍스트 시도
-                code_block_match = re.search(r'```\s*([\s\S]*?)\s*```', response)
-                if code_block_match:
-                    potential_json = code_block_match.group(1).strip()
+                block_start = response.find("```")
+                block_end = response.find("```", block_start + 3) if block_start != -1 else -1
+                if block_end != -1:
+                    potential_json = response[block_start + 3:block_end].strip()
                     # JSON 유효성 검사
                     try:
-                        json.loads(potential_json)
+                        parsed = json_utils.loads(potential_json)
                         json_content = potential_json
                         self.logger.debug("일반 코드 블록에서 JSON 콘텐츠 추출됨")
-                    except json.JSONDecodeError:
+                    except json_utils.JSONDecodeError:
                         pass
                         
                 if not json_content:
                     # 3. 응답 전체가 JSON인지 확인
                     try:
-                        json.loads(response.strip())
-                        json_content = response.strip()
+                        parsed = json_utils.loads(stripped)
+                        json_content = stripped
                         self.logger.debug("전체 응답이 JSON으로 처리됨")
-                    except json.JSONDecodeError:
-                        # 4. 응답에서 [ 로 시작하고 ] 로 끝나는 부분 찾기
-                        array_match = re.search(r'(\[\s*\{.*\}\s*\])', response, re.DOTALL)
-                        if array_match:
-                            json_content = array_match.group(1).strip()
-                            self.logger.debug("배열 패턴에서 JSON 추출됨")
-                        else:
-                            # 5. { 로 시작하고 } 로 끝나는 부분 찾기 (단일 객체)
-                            obj_match = re.search(r'(\{\s*".*"\s*:.*\})', response, re.DOTALL)
-                            if obj_match:
-                                json_content = obj_match.group(1).strip()
-                                self.logger.debug("객체 패턴에서 JSON 추출됨")
+                    except json_utils.JSONDecodeError:
+                        # 4. 괄호 짝을 맞춰 응답 속 첫 번째 JSON 배열/객체 추출 (문자열 안의 괄호는 무시)
+                        for open_char in "[{":
+                            span = _find_balanced_json(response, open_char)
+                            if span is None:
+                                continue
+                            try:
+                                candidate = json_utils.loads(span)
+                            except json_utils.JSONDecodeError:
+                                continue
+                            # Q&A 객체 목록 또는 단일 객체만 사용
+                            if isinstance(candidate, dict) or (
+                                isinstance(candidate, list) and candidate
+                                and all(isinstance(entry, dict) for entry in candidate)
+                            ):
+                                parsed = candidate
+                                json_content = span
+                                self.logger.debug("괄호 짝 분석으로 JSON 추출됨")
+                                break
+                        
+                        if not json_content:
+                            # 5. 응답에서 [{ 로 시작하는 객체 배열을 괄호 짝으로 찾기
+                            # (.*를 쓰는 정규식은 닫히지 않은 응답에서 전체를 반복 탐색하므로 시작 위치만 정규식으로 찾음)
+                            array_match = _JSON_ARRAY_START_RE.search(response)
+                            if array_match:
+                                json_content = _find_balanced_json(response, '[', array_match.start())
+                            if json_content:
+                                self.logger.debug("배열 패턴에서 JSON 추출됨")
                             else:
-                                # 마지막 방법: 줄별로 분석하여 JSON 부분 찾기
-                                for line in response.splitlines():
-                                    line = line.strip()
-                                    if (line.startswith('{') and line.endswith('}')) or (line.startswith('[') and line.endswith(']')):
-                                        try:
-                                            json.loads(line)
-                                            json_content = line
-                                            self.logger.debug("줄별 분석에서 JSON 발견됨")
-                                            break
-                                        except json.JSONDecodeError:
-                                            continue
+                                # 6. {" 로 시작하는 단일 객체를 괄호 짝으로 찾기
+                                obj_match = _JSON_OBJECT_START_RE.search(response)
+                                if obj_match:
+                                    json_content = _find_balanced_json(response, '{', obj_match.start())
+                                if json_content:
+                                    self.logger.debug("객체 패턴에서 JSON 추출됨")
+                                else:
+                                    # 마지막 방법: 줄별로 분석하여 JSON 부분 찾기
+                                    for line in response.splitlines():
+                                        line = line.strip()
+                                        if (line.startswith('{') and line.endswith('}')) or (line.startswith('[') and line.endswith(']')):
+                                            try:
+                                                parsed = json_utils.loads(line)
+                                                json_content = line
+                                                self.logger.debug("줄별 분석에서 JSON 발견됨")
+                                                break
+                                            except json_utils.JSONDecodeError:
+                                                continue
             
-            if not json_content:
-                # JSON을 찾지 못한 경우 텍스트 기반으로 항목 생성 시도
-                self.logger.warning("JSON을 찾을 수 없어 텍스트 기반 파싱 시도")
-                text_items = self._create_qa_from_text(response, difficulty)
-                if text_items:
-                    return text_items
+            if json_content:
+                if not isinstance(parsed, (list, dict)):
+                    # JSON 파싱 전 정리 (추가된 부분)
+                    # 때로는 JSON 문자열 앞뒤에 따옴표나 백틱이 포함될 수 있음
+                    json_content = json_content.strip('`"\' ')
+                    
+                    # JSON 파싱
+                    parsed = json_utils.loads(json_content)
                 
-                # SQL 쿼리가 직접 있는지 확인
-                if "SELECT" in response and "FROM" in response:
-                    self.logger.info("SQL 쿼리가 감지되어 수동 항목 생성")
-                    manual_item = self._create_manual_qa_item(response, difficulty)
-                    if manual_item:
-                        return [manual_item]
+                qa_items = self._finalize_parsed_items(parsed, difficulty)
+                if qa_items:
+                    return qa_items
                 
-                return []
-            
-            # JSON 파싱 전 정리 (추가된 부분)
-            # 때로는 JSON 문자열 앞뒤에 따옴표나 백틱이 포함될 수 있음
-            json_content = json_content.strip('`"\' ')
-            
-            # JSON 파싱
-            qa_items = json.loads(json_content)
+                # JSON에 Q&A 객체가 없으면 텍스트 기반 파싱으로 대체
+                self.logger.warning("JSON에 유효한 Q&A 항목이 없어 텍스트 기반 파싱 시도")
+            else:
+                # JSON을 찾지 못한 경우 텍스트 기반으로 항목 생성 시도
+                self.logger.warning("JSON을 찾을 수 없어 텍스트 기반 파싱 시도")
             
-            # 단일 항목인 경우 리스트로 변환
-            if isinstance(qa_items, dict):
-                qa_items = [qa_items]
+            text_items = self._create_qa_from_text(response, difficulty)
+            if text_items:
+                return text_items
             
-            # 각 항목에 누락된 정보 추가
-            for item in qa_items:
-                if "difficulty" not in item:
-                    item["difficulty"] = difficulty
+            # SQL 쿼리가 직접 있는지 확인
+            if "SELECT" in response and "FROM" in response:
+                self.logger.info("SQL 쿼리가 감지되어 수동 항목 생성")
+                manual_item = self._create_manual_qa_item(response, difficulty)
+                if manual_item:
+                    return [manual_item]
             
-            self.logger.info(f"텍스트에서 {len(qa_items)}개 항목 추출 성공")
-            return qa_items
+            return []
                 
-        except json.JSONDecodeError as e:
+        except json_utils.JSONDecodeError as e:
             self.logger.error(f"JSON 파싱 오류: {str(e)}")
             self.logger.debug(f"파싱 시도한 내용: {response[:500]}")
             return self._create_qa_from_text(response, difficulty)
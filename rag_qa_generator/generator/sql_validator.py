@@ -10,6 +10,10 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from data.schema_loader import SchemaLoader
 
+# validate_sql에서 SQL마다 사용하는 테이블 추출 정규식 (모듈 로드 시 한 번만 컴파일)
+# FROM/JOIN 뒤의 테이블명을 한 번의 스캔으로 추출
+_USED_TABLE_RE = re.compile(r'(?:FROM|JOIN)\s+([a-zA-Z0-9_]+)', re.IGNORECASE)
+
 class SQLValidator:
     """SQL 쿼리 유효성 검증 클래스"""
     
@@ -22,6 +26,8 @@ class SQLValidator:
         self.tables = {}
         self.columns = {}
         self.aliases = {}
+        # SQL 식별자는 대소문자를 구분하지 않으므로 테이블 존재 확인은 소문자 이름으로 수행
+        self._table_names_lower = frozenset()
         
         # 로거 초기화 추가
         self.logger = logging.getLogger(__name__)
@@ -70,6 +76,9 @@ class SQLValidator:
                                         {"name": col_name}
                                     )
                             
+        # 테이블 존재 확인용 소문자 테이블명 집합 (QAGenerator의 사전 검사와 같은 기준)
+        self._table_names_lower = frozenset(str(name).lower() for name in self.tables)
+        
         # 각 테이블의 컬럼 정보 캐싱
         self.columns = {}
         for table_name, table_info in self.tables.items():
@@ -107,11 +116,12 @@ class SQLValidator:
             result["errors"].append("SQL 쿼리가 비어 있습니다.")
             return result
         
-        # 기본 문법 확인
-        if not sql.upper().startswith("SELECT"):
+        # 기본 문법 확인 (대문자 변환은 한 번만 수행)
+        sql_upper = sql.upper()
+        if not sql_upper.startswith("SELECT"):
             result["errors"].append("SQL 쿼리는 SELECT로 시작해야 합니다.")
         
-        if "FROM" not in sql.upper():
+        if "FROM" not in sql_upper:
             result["errors"].append("FROM 절이 필요합니다.")
         
         # 테이블 및 컬럼 유효성 검사
@@ -124,20 +134,13 @@ class SQLValidator:
                 self.logger.debug(f"스키마에서 추출한 테이블: {tables_in_schema}")
             
             # SQL에서 사용된 테이블 추출
-            used_tables = []
-            from_match = re.findall(r'FROM\s+([a-zA-Z0-9_]+)', sql, re.IGNORECASE)
-            join_match = re.findall(r'JOIN\s+([a-zA-Z0-9_]+)', sql, re.IGNORECASE)
-            
-            if from_match:
-                used_tables.extend(from_match)
-            if join_match:
-                used_tables.extend(join_match)
+            used_tables = _USED_TABLE_RE.findall(sql)
             
             if is_debug:
                 self.logger.debug(f"SQL에서 사용된 테이블: {used_tables}")
             
             # 테이블 존재 여부 확인
-            invalid_tables = [table for table in used_tables if table not in tables_in_schema]
+            invalid_tables = [table for table in used_tables if table.lower() not in self._table_names_lower]
             if invalid_tables:
                 tables_str = ", ".join(invalid_tables)
                 result["errors"].append(f"테이블이 스키마에 존재하지 않습니다: {tables_str}")
@@ -201,7 +204,7 @@ class SQLValidator:
                 real_table = self.aliases[table]
             
             # 테이블 존재 여부 확인
-            if real_table not in self.tables:
+            if real_table.lower() not in self._table_names_lower:
                 errors.append(f"테이블 '{real_table}'이 스키마에 존재하지 않습니다.")
         
         # 컬럼 참조 유효성 검증
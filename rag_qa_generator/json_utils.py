@@ -0,0 +1,59 @@
+# json_utils.py
+"""JSON 직렬화/역직렬화 공용 헬퍼
+
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 대체합니다.
+"""
+import json
+from pathlib import Path
+from typing import Any, Union
+
+# orjson 사용 가능 여부 확인
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스이므로 하나로 처리 가능
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """JSON 문자열 또는 바이트 파싱"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """객체를 UTF-8 JSON 바이트로 변환"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    # 들여쓰기가 없으면 orjson과 같이 구분자 뒤 공백 없이 출력
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """객체를 JSON 문자열로 변환 (비 ASCII 문자는 이스케이프하지 않음)"""
+    return dumps_bytes(obj, indent).decode('utf-8')
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """JSON 파일 로드 (바이트로 읽어 텍스트 디코딩 단계 생략)
+    
+    파일 전체를 한 번에 읽은 뒤 파싱하므로 큰 파일도 작은 버퍼 단위로
+    나누어 읽지 않습니다. 표준 json도 바이트 입력을 직접 받습니다.
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_file(obj: Any, path: Union[str, Path], indent: bool = True) -> None:
+    """객체를 JSON 파일로 저장 (UTF-8)"""
+    with open(path, 'wb') as f:
+        f.write(dumps_bytes(obj, indent))
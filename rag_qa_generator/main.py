@@ -40,6 +40,7 @@ def parse_args():
     parser.add_argument("--sequential", dest="parallel", action="store_false", help="순차 처리 활성화")
     parser.add_argument("--workers", type=int, default=4, help="최대 작업자 수")
     parser.add_argument("--batch-size", type=int, default=5, help="배치 크기")
+    parser.add_argument("--rps", type=float, help="초당 최대 모델 요청 수 (기본값: 제한 없음)")
     
     # 추가 설정
     parser.add_argument("--no-validate", dest="validate_sql", action="store_false", 
@@ -49,6 +50,8 @@ def parse_args():
     parser.add_argument("--config", type=str, help="설정 파일 경로")
     parser.add_argument("--log-level", type=str, choices=["DEBUG", "INFO", "WARNING", "ERROR"], 
                         default="INFO", help="로그 레벨")
+    parser.add_argument("--async-log", dest="async_logging", action="store_true",
+                        help="로그 출력을 별도 스레드에서 수행 (대량 로그 시 생성 지연 감소)")
     
     return parser.parse_args()
 
@@ -113,6 +116,9 @@ def create_config_from_args(args) -> AppConfig:
         
     if args.batch_size:
         config.batch_size = args.batch_size
+        
+    if args.rps is not None:
+        config.requests_per_second = args.rps
     
     # SQL 유효성 검증 설정
     if hasattr(args, 'validate_sql'):
@@ -126,6 +132,10 @@ def create_config_from_args(args) -> AppConfig:
     if args.log_level:
         config.log_level = args.log_level
     
+    # 비동기 로그 출력 설정
+    if args.async_logging:
+        config.async_logging = True
+    
     return config
 
 def main():
@@ -147,10 +157,12 @@ def main():
     logger = setup_logger(
         name="rag_qa_generator",
         level=config.log_level,
-        log_file=Path("logs/generator.log")
+        log_file=Path("logs/generator.log"),
+        async_output=config.async_logging
     )
     logger.info("Q&A 생성기 시작")
     
+    model = None
     try:
         # 모델 초기화
         logger.info(f"모델 초기화: {config.model_config.model_type} - {config.model_config.model_name}")
@@ -189,7 +201,8 @@ def main():
             qa_loader=qa_loader,
             validate_sql=config.validate_sql,
             max_retries=config.max_retries,
-            logger=logger
+            logger=logger,
+            requests_per_second=config.requests_per_second
         )
         
         # 결과 저장 경로 생성
@@ -250,6 +263,10 @@ def main():
     except Exception as e:
         logger.error(f"실행 중 오류 발생: {str(e)}", exc_info=True)
         sys.exit(1)
+    finally:
+        # 모델의 HTTP 연결 정리 (sys.exit로 종료하는 경우 포함)
+        if model is not None:
+            model.close()
     
     logger.info("Q&A 생성기 종료")
 
@@ -1,7 +1,28 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from typing import Dict, List, Optional, Any, Generator, Union, Tuple
+import asyncio
+import functools
+import random
 import time
 
+# 재시도 간 최대 대기 시간(초)
+_MAX_RETRY_DELAY = 30.0
+
+
+def backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = _MAX_RETRY_DELAY) -> float:
+    """재시도 대기 시간(초) 계산 (지터를 더한 지수 백오프)
+    
+    여러 작업자가 동시에 실패해도 같은 시점에 몰려서 재시도하지 않도록
+    base_delay * 2^attempt에 0.5~1.5배의 무작위 배율을 곱하고 max_delay로 제한합니다.
+    
+    Args:
+        attempt: 0부터 시작하는 재시도 순번
+        base_delay: 첫 재시도의 기준 대기 시간(초)
+        max_delay: 최대 대기 시간(초)
+    """
+    return min(max_delay, base_delay * (2 ** attempt) * (0.5 + random.random()))
+
 class BaseModel(ABC):
     """모든 LLM 모델의 기본 인터페이스를 정의하는 추상 클래스"""
     
@@ -99,13 +120,57 @@ class BaseModel(ABC):
                 error = e
                 attempts += 1
                 if attempts < max_retries:
-                    # 지수 백오프 적용
-                    delay = retry_delay * (2 ** (attempts - 1))
-                    time.sleep(delay)
+                    # 지수 백오프 적용 (실패한 경우에만 대기하며 최대 대기 시간 제한)
+                    time.sleep(backoff_delay(attempts - 1, retry_delay))
         
         # 모든 재시도 실패 시 빈 문자열 반환하고 실패 표시
         return str(error), False
     
+    async def agenerate_with_retry(
+        self, 
+        prompt: str, 
+        system_prompt: Optional[str] = None,
+        max_retries: int = 3,
+        executor: Optional[Executor] = None,
+        **kwargs
+    ) -> Tuple[str, bool]:
+        """재시도 로직이 포함된 비동기 텍스트 생성
+        
+        기본 구현은 generate_with_retry를 실행기 스레드에서 실행합니다.
+        비동기 클라이언트를 지원하는 모델은 재정의할 수 있습니다.
+        
+        Args:
+            prompt: 모델에 전달할 프롬프트
+            system_prompt: 시스템 프롬프트 (지원하는 모델만)
+            max_retries: 최대 재시도 횟수
+            executor: 요청을 실행할 실행기 (None이면 이벤트 루프의 기본 실행기)
+            **kwargs: 생성 시 추가 파라미터
+            
+        Returns:
+            (생성된 텍스트, 성공 여부) 튜플
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            functools.partial(
+                self.generate_with_retry,
+                prompt=prompt,
+                system_prompt=system_prompt,
+                max_retries=max_retries,
+                **kwargs
+            )
+        )
+    
+    def close(self) -> None:
+        """모델이 보유한 네트워크 자원 정리 (기본 구현은 아무것도 하지 않음)"""
+        pass
+    
+    def __enter__(self) -> "BaseModel":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def get_model_info(self) -> Dict[str, Any]:
         """모델 정보 반환
         
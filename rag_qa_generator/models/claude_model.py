@@ -198,4 +198,8 @@ class ClaudeModel(BaseModel):
             self.client.count_tokens("test")
             return True
         except Exception:
-            return False
\ No newline at end of file
+            return False
+    
+    def close(self) -> None:
+        """Anthropic 클라이언트의 HTTP 연결 정리"""
+        self.client.close()
@@ -1,11 +1,11 @@
-import json
 import requests
 import time
 from typing import Dict, Optional, Generator, Any, Tuple
 import tiktoken
 
+import json_utils
 
-from .base_model import BaseModel
+from .base_model import BaseModel, backoff_delay
 
 class OllamaModel(BaseModel):
     """Ollama 모델 구현 클래스"""
@@ -35,6 +35,9 @@ class OllamaModel(BaseModel):
         self.top_p = top_p
         self.kwargs = kwargs
         
+        # 호출마다 새 연결을 맺지 않도록 keep-alive 연결 풀을 가진 세션 재사용
+        self.session = requests.Session()
+        
         # Tiktoken을 사용한 토큰 카운팅을 위한 인코더 초기화 (fallback)
         try:
             self.tokenizer = tiktoken.get_encoding("cl100k_base")
@@ -104,7 +107,7 @@ class OllamaModel(BaseModel):
             print(f"Chat API 요청: {chat_endpoint}")
             print(f"온도: {chat_payload['temperature']}, 최대 토큰: {chat_payload['num_predict']}")
             
-            response = requests.post(chat_endpoint, json=chat_payload, timeout=120)
+            response = self.session.post(chat_endpoint, json=chat_payload, timeout=120)
             
             if response.status_code == 200:
                 try:
@@ -159,7 +162,7 @@ class OllamaModel(BaseModel):
             print(f"Generate API 요청: {endpoint}")
             print(f"페이로드: {payload}")
             
-            response = requests.post(endpoint, json=payload, timeout=120)
+            response = self.session.post(endpoint, json=payload, timeout=120)
             response.raise_for_status()
             
             # 응답 디버깅
@@ -178,10 +181,10 @@ class OllamaModel(BaseModel):
                             continue
                         
                         try:
-                            data = json.loads(line)
+                            data = json_utils.loads(line)
                             if "response" in data:
                                 result_text += data["response"]
-                        except json.JSONDecodeError:
+                        except json_utils.JSONDecodeError:
                             result_text += line  # JSON이 아니면 그대로 추가
                             
                     # 아무것도 추출되지 않았으면 원본 반환
@@ -226,7 +229,12 @@ class OllamaModel(BaseModel):
     }
     ]"""
             print("API 실패 - 응급 샘플 데이터 반환")
-            return emergency_response 
+            return emergency_response
+    
+    def close(self) -> None:
+        """HTTP 세션의 연결 풀 정리"""
+        self.session.close()
+    
     def generate_with_retry(self, prompt: str, system_prompt: Optional[str] = None, max_retries: int = 3, **kwargs) -> Tuple[str, bool]:
         """재시도 기능을 포함한 텍스트 생성
         
@@ -265,14 +273,14 @@ class OllamaModel(BaseModel):
                     # 상세 로그
                     print(f"빈 응답 수신 (재시도 {retry_count+1}/{max_retries+1})")
                     retry_count += 1
-                    time.sleep(2)
+                    self._wait_before_retry(retry_count, max_retries)
                     continue
                 
                 # 응답이 JSON을 포함하는지 확인 (JSON이 요청된 경우)
                 if "json" in prompt.lower() and not self._contains_json(response):
                     print(f"유효한 JSON이 없는 응답 수신 (재시도 {retry_count+1}/{max_retries+1})")
                     retry_count += 1
-                    time.sleep(2)
+                    self._wait_before_retry(retry_count, max_retries)
                     continue
                 
                 return response, True
@@ -280,11 +288,17 @@ class OllamaModel(BaseModel):
             except Exception as e:
                 print(f"생성 중 오류 발생: {str(e)} (재시도 {retry_count+1}/{max_retries+1})")
                 retry_count += 1
-                time.sleep(2)
+                self._wait_before_retry(retry_count, max_retries)
         
         # 모든 재시도 실패
         return f"최대 재시도 횟수 초과 ({max_retries}회)", False
     
+    @staticmethod
+    def _wait_before_retry(retry_count: int, max_retries: int) -> None:
+        """다음 시도 전 대기 (지터를 더한 지수 백오프, 마지막 실패 후에는 대기하지 않음)"""
+        if retry_count <= max_retries:
+            time.sleep(backoff_delay(retry_count - 1))
+    
     def _contains_json(self, text: str) -> bool:
         """문자열이 JSON 내용을 포함하는지 확인
         
@@ -312,9 +326,9 @@ class OllamaModel(BaseModel):
             line = line.strip()
             if (line.startswith('{') and line.endswith('}')) or (line.startswith('[') and line.endswith(']')):
                 try:
-                    json.loads(line)
+                    json_utils.loads(line)
                     return True
-                except json.JSONDecodeError:
+                except json_utils.JSONDecodeError:
                     continue
         
         return False
@@ -361,7 +375,7 @@ class OllamaModel(BaseModel):
             payload["repeat_penalty"] = kwargs.get("repeat_penalty", 1.1)
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 endpoint, 
                 json=payload, 
                 stream=True,  # 스트리밍 응답 설정
@@ -384,10 +398,10 @@ class OllamaModel(BaseModel):
                             break
                             
                         try:
-                            chunk = json.loads(line_json)
+                            chunk = json_utils.loads(line_json)
                             if 'response' in chunk:
                                 yield chunk['response']
-                        except json.JSONDecodeError:
+                        except json_utils.JSONDecodeError:
                             # JSON 파싱 실패 시 원시 텍스트 그대로 반환
                             yield line_text
                     except Exception:
@@ -414,7 +428,7 @@ class OllamaModel(BaseModel):
                 "model": self.model_name,
                 "prompt": text
             }
-            response = requests.post(endpoint, json=payload, timeout=10)
+            response = self.session.post(endpoint, json=payload, timeout=10)
             response.raise_for_status()
             result = response.json()
             return len(result.get("tokens", []))
@@ -436,13 +450,13 @@ class OllamaModel(BaseModel):
         try:
             # Ollama 서버 연결 확인
             endpoint = f"{self.api_base}/version"
-            response = requests.get(endpoint, timeout=5)
+            response = self.session.get(endpoint, timeout=5)
             response.raise_for_status()
             
             # 특정 모델 사용 가능 여부 확인
             try:
                 models_endpoint = f"{self.api_base}/tags"
-                models_response = requests.get(models_endpoint, timeout=5)
+                models_response = self.session.get(models_endpoint, timeout=5)
                 models_response.raise_for_status()
                 
                 models_data = models_response.json()
@@ -197,6 +197,10 @@ class OpenAIModel(BaseModel):
         except Exception:
             return False
     
+    def close(self) -> None:
+        """OpenAI 클라이언트의 HTTP 연결 정리"""
+        self.client.close()
+    
     def _prepare_messages(
         self, 
         prompt: str, 
@@ -150,11 +150,15 @@ def initialize_model(model_type, model_name, temperature, api_key, api_base):
         
         # 모델 사용 가능 여부 확인
         if not model.is_available():
+            model.close()
             st.error(f"모델을 사용할 수 없습니다: {model_name}")
             return False
         
-        # 모델 저장
+        # 모델 저장 (교체되는 이전 모델의 HTTP 연결은 정리)
+        previous_model = st.session_state.model
         st.session_state.model = model
+        if previous_model is not None and previous_model is not model:
+            previous_model.close()
         return True
         
     except Exception as e:
@@ -184,7 +188,8 @@ def initialize_generator():
             qa_loader=st.session_state.qa_loader,
             validate_sql=st.session_state.config.validate_sql,
             max_retries=st.session_state.config.max_retries,
-            logger=logger
+            logger=logger,
+            requests_per_second=st.session_state.config.requests_per_second
         )
         
         return True
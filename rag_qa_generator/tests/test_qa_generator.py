@@ -0,0 +1,64 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("rich")
+pytest.importorskip("sqlparse")
+
+import json_utils
+from data.schema_loader import SchemaLoader
+from generator.qa_generator import QAGenerator
+from models.base_model import BaseModel
+
+
+class _StubModel(BaseModel):
+    """모델 호출이 필요 없는 테스트용 모델"""
+
+    def generate(self, prompt, system_prompt=None, **kwargs):
+        return ""
+
+    def generate_stream(self, prompt, system_prompt=None, **kwargs):
+        yield ""
+
+    def count_tokens(self, text):
+        return len(text)
+
+    def is_available(self):
+        return True
+
+
+def _write_schema(path, table_name):
+    """단일 테이블 스키마 파일 작성"""
+    json_utils.dump_file({
+        "tables": [
+            {
+                "name": table_name,
+                "columns": [
+                    {"name": "id", "type": "INTEGER", "primary_key": True},
+                    {"name": "name", "type": "TEXT"},
+                ],
+            }
+        ]
+    }, path)
+
+
+def test_refresh_schema_rebuilds_schema_adapter(tmp_path):
+    schema_path = tmp_path / "schema.json"
+    _write_schema(schema_path, "old_table")
+
+    generator = QAGenerator(_StubModel("stub"), SchemaLoader(schema_path), validate_sql=False)
+
+    # 스키마 파일 변경 (mtime 해상도와 무관하게 변경이 감지되도록 mtime을 명시적으로 갱신)
+    _write_schema(schema_path, "new_table")
+    stat = schema_path.stat()
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert generator.refresh_schema()
+
+    # 응급 항목은 스키마 어댑터가 보관한 스키마로 생성되므로 새 스키마를 반영해야 함
+    adapter = generator.schema_adapter
+    assert [table["name"] for table in adapter.schema["tables"]] == ["new_table"]
+    assert set(adapter.schema_tables) == {"new_table"}
@@ -6,11 +6,13 @@ from .logger import (
     log_success, 
     log_progress
 )
+from .rate_limiter import RateLimiter
 
 __all__ = [
     'setup_logger',
     'get_logger',
     'get_time_logger',
     'log_success',
-    'log_progress'
+    'log_progress',
+    'RateLimiter'
 ]
\ No newline at end of file
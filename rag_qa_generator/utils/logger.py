@@ -1,5 +1,8 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
@@ -19,6 +22,22 @@ custom_theme = Theme({
 
 console = Console(theme=custom_theme)
 
+# 비동기 출력 로거별 큐 리스너 (로거를 다시 설정할 때 이전 리스너 정지)
+_queue_listeners = {}
+
+def _stop_queue_listener(name: str) -> None:
+    """로거에 연결된 큐 리스너를 정지하고 남은 로그를 모두 출력"""
+    listener = _queue_listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+
+def _stop_all_queue_listeners() -> None:
+    """프로그램 종료 시 모든 큐 리스너 정지 (대기 중인 로그 유실 방지)"""
+    for name in list(_queue_listeners):
+        _stop_queue_listener(name)
+
+atexit.register(_stop_all_queue_listeners)
+
 class CustomFormatter(logging.Formatter):
     """로그 포맷터 커스터마이징"""
     
@@ -39,7 +58,8 @@ def setup_logger(
     name: str = "rag_qa_generator",
     level: str = "INFO",
     log_file: Optional[Path] = None,
-    console_output: bool = True
+    console_output: bool = True,
+    async_output: bool = False
 ) -> logging.Logger:
     """로거 설정 및 반환
     
@@ -48,6 +68,9 @@ def setup_logger(
         level: 로그 레벨 ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
         log_file: 로그 파일 경로 (None이면 파일 로깅 안함)
         console_output: 콘솔 출력 여부
+        async_output: 로그 포맷팅과 출력을 별도 스레드에서 수행할지 여부
+            (로그를 호출한 스레드는 큐에 레코드만 넣고 바로 반환, 예외 정보는 큐에 넣을 때
+            텍스트로 변환되므로 콘솔에 Rich 트레이스백 대신 텍스트 트레이스백이 출력됨)
         
     Returns:
         설정된 로거 객체
@@ -60,6 +83,7 @@ def setup_logger(
     logger.setLevel(log_level)
     
     # 기존 핸들러 제거 (중복 로깅 방지)
+    _stop_queue_listener(name)
     if logger.handlers:
         for handler in logger.handlers:
             logger.removeHandler(handler)
@@ -94,6 +118,20 @@ def setup_logger(
         )
         logger.addHandler(file_handler)
     
+    # 비동기 출력: 설정한 핸들러를 큐 리스너 스레드로 옮기고 로거에는 큐 핸들러만 연결
+    if async_output and logger.handlers:
+        output_handlers = list(logger.handlers)
+        for handler in output_handlers:
+            logger.removeHandler(handler)
+        
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(
+            log_queue, *output_handlers, respect_handler_level=True
+        )
+        listener.start()
+        _queue_listeners[name] = listener
+    
     return logger
 
 def get_logger(
@@ -0,0 +1,51 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+class RateLimiter:
+    """토큰 버킷 방식의 요청 속도 제한기
+
+    초당 rate개의 토큰이 채워지고 최대 burst개까지 쌓입니다. 여러 스레드와
+    이벤트 루프에서 공유할 수 있으며, rate가 None 또는 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None):
+        """
+        Args:
+            rate: 초당 허용 요청 수 (None 또는 0 이하이면 제한 없음)
+            burst: 연속으로 허용할 최대 요청 수 (기본값: max(1, rate))
+        """
+        self.rate = rate if rate and rate > 0 else None
+        self.capacity = float(burst if burst else max(1, int(self.rate or 1)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고 요청 전에 기다려야 할 시간(초) 반환"""
+        if self.rate is None:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            # 토큰이 부족하면 부족분이 채워질 때까지 대기 (예약은 이미 반영됨)
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """요청 전에 호출 (필요한 경우에만 대기)"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """요청 전에 호출 (비동기, 대기 중에도 다른 작업 진행)"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)